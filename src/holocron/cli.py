@@ -503,32 +503,31 @@ def review(
         raise typer.Exit(1)
 
     async def run_review():
-        db = get_db()
-        repo = LearnerRepository(db)
-        await db.initialize()
+        async with get_db() as db:
+            repo = LearnerRepository(db)
 
-        # Check for due concepts
-        due = await repo.get_concepts_due_for_review(learner_name, domain)
+            # Check for due concepts
+            due = await repo.get_concepts_due_for_review(learner_name, domain)
 
-        if not due:
-            console.print("[green]No concepts due for review![/green]")
-            console.print("[dim]Use 'holocron learn' to study new content.[/dim]")
-            return
+            if not due:
+                console.print("[green]No concepts due for review![/green]")
+                console.print("[dim]Use 'holocron learn' to study new content.[/dim]")
+                return
 
-        console.print(f"[yellow]{len(due)} concepts due for review[/yellow]")
-        console.print()
+            console.print(f"[yellow]{len(due)} concepts due for review[/yellow]")
+            console.print()
 
-        # Start interactive review session
-        from holocron.repl import SessionController
+            # Start interactive review session
+            from holocron.repl import SessionController
 
-        controller = SessionController(
-            learner_id=learner_name,
-            domain_id=domain,
-            db=db,
-        )
-        await controller.initialize()
-        await controller._cmd_review([])  # Trigger review mode
-        await controller.run()
+            controller = SessionController(
+                learner_id=learner_name,
+                domain_id=domain,
+                db=db,
+            )
+            await controller.initialize()
+            await controller._cmd_review([])  # Trigger review mode
+            await controller.run()
 
     run_async(run_review())
 
@@ -556,21 +555,21 @@ def learner_create(
         learner_id = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
 
     async def create():
-        db = get_db()
-        repo = LearnerRepository(db)
+        async with get_db() as db:
+            repo = LearnerRepository(db)
 
-        # Check if exists
-        if await repo.exists(learner_id):
-            console.print(f"[red]Learner '{learner_id}' already exists.[/red]")
-            raise typer.Exit(1)
+            # Check if exists
+            if await repo.exists(learner_id):
+                console.print(f"[red]Learner '{learner_id}' already exists.[/red]")
+                raise typer.Exit(1)
 
-        # Create profile
-        profile = LearnerProfile(learner_id=learner_id, name=name)
-        await repo.save(profile)
+            # Create profile
+            profile = LearnerProfile(learner_id=learner_id, name=name)
+            await repo.save(profile)
 
-        console.print(f"[green]Created learner profile:[/green]")
-        console.print(f"  ID: {learner_id}")
-        console.print(f"  Name: {name}")
+            console.print(f"[green]Created learner profile:[/green]")
+            console.print(f"  ID: {learner_id}")
+            console.print(f"  Name: {name}")
 
     run_async(create())
 
@@ -580,35 +579,35 @@ def learner_list() -> None:
     """List all learner profiles."""
 
     async def list_learners():
-        db = get_db()
-        repo = LearnerRepository(db)
-        profiles = await repo.list_all()
-
-        if not profiles:
-            console.print("[yellow]No learner profiles found.[/yellow]")
-            console.print("Create one with: holocron learner create <name>")
-            return
-
-        table = Table(title="Learner Profiles")
-        table.add_column("ID", style="cyan")
-        table.add_column("Name", style="green")
-        table.add_column("Created", style="dim")
-        table.add_column("Study Time", justify="right")
-        table.add_column("Streak", justify="right")
-
-        for profile in profiles:
-            created = profile.created_at.strftime("%Y-%m-%d")
-            study_time = f"{profile.total_study_time_minutes} min"
-            streak = f"{profile.current_streak_days} days"
-            table.add_row(
-                profile.learner_id,
-                profile.name,
-                created,
-                study_time,
-                streak,
-            )
+        async with get_db() as db:
+            repo = LearnerRepository(db)
+            profiles = await repo.list_summaries()
+
+            if not profiles:
+                console.print("[yellow]No learner profiles found.[/yellow]")
+                console.print("Create one with: holocron learner create <name>")
+                return
+
+            table = Table(title="Learner Profiles")
+            table.add_column("ID", style="cyan")
+            table.add_column("Name", style="green")
+            table.add_column("Created", style="dim")
+            table.add_column("Study Time", justify="right")
+            table.add_column("Streak", justify="right")
+
+            for profile in profiles:
+                created = profile.created_at.strftime("%Y-%m-%d")
+                study_time = f"{profile.total_study_time_minutes} min"
+                streak = f"{profile.current_streak_days} days"
+                table.add_row(
+                    profile.learner_id,
+                    profile.name,
+                    created,
+                    study_time,
+                    streak,
+                )
 
-        console.print(table)
+            console.print(table)
 
     run_async(list_learners())
 
@@ -620,54 +619,54 @@ def learner_stats(
     """Show statistics for a learner."""
 
     async def show_stats():
-        db = get_db()
-        repo = LearnerRepository(db)
+        async with get_db() as db:
+            repo = LearnerRepository(db)
 
-        stats = await repo.get_learner_stats(learner_id)
-        if not stats:
-            console.print(f"[red]Learner '{learner_id}' not found.[/red]")
-            raise typer.Exit(1)
+            stats = await repo.get_learner_stats(learner_id)
+            if not stats:
+                console.print(f"[red]Learner '{learner_id}' not found.[/red]")
+                raise typer.Exit(1)
 
-        console.print()
-        console.print(
-            Panel(
-                f"[bold]Name:[/bold] {stats['name']}\n"
-                f"[bold]Study Time:[/bold] {stats['total_study_time_minutes']} minutes\n"
-                f"[bold]Current Streak:[/bold] {stats['current_streak_days']} days\n"
-                f"[bold]Concepts Mastered:[/bold] {stats['concepts_mastered']}",
-                title=f"Learner: {learner_id}",
-                border_style="cyan",
+            console.print()
+            console.print(
+                Panel(
+                    f"[bold]Name:[/bold] {stats['name']}\n"
+                    f"[bold]Study Time:[/bold] {stats['total_study_time_minutes']} minutes\n"
+                    f"[bold]Current Streak:[/bold] {stats['current_streak_days']} days\n"
+                    f"[bold]Concepts Mastered:[/bold] {stats['concepts_mastered']}",
+                    title=f"Learner: {learner_id}",
+                    border_style="cyan",
+                )
             )
-        )
 
-        # Domain breakdown
-        if stats["domains"]:
+            # Domain breakdown
+            if stats["domains"]:
+                console.print()
+                table = Table(title="Domain Progress")
+                table.add_column("Domain", style="cyan")
+                table.add_column("Concepts", justify="right")
+                table.add_column("Avg Mastery", justify="right")
+
+                for domain_id, domain_stats in stats["domains"].items():
+                    table.add_row(
+                        domain_id,
+                        str(domain_stats["concept_count"]),
+                        f"{domain_stats['avg_mastery']}%",
+                    )
+                console.print(table)
+
+            # Assessment stats
             console.print()
-            table = Table(title="Domain Progress")
-            table.add_column("Domain", style="cyan")
-            table.add_column("Concepts", justify="right")
-            table.add_column("Avg Mastery", justify="right")
-
-            for domain_id, domain_stats in stats["domains"].items():
-                table.add_row(
-                    domain_id,
-                    str(domain_stats["concept_count"]),
-                    f"{domain_stats['avg_mastery']}%",
+            console.print(
+                Panel(
+                    f"[bold]Total Assessments:[/bold] {stats['total_assessments']}\n"
+                    f"[bold]Correct:[/bold] {stats['correct_assessments']}\n"
+                    f"[bold]Accuracy:[/bold] {stats['accuracy']}%\n"
+                    f"[bold]Due for Review:[/bold] {stats['concepts_due_for_review']}",
+                    title="Assessment Stats",
+                    border_style="green",
                 )
-            console.print(table)
-
-        # Assessment stats
-        console.print()
-        console.print(
-            Panel(
-                f"[bold]Total Assessments:[/bold] {stats['total_assessments']}\n"
-                f"[bold]Correct:[/bold] {stats['correct_assessments']}\n"
-                f"[bold]Accuracy:[/bold] {stats['accuracy']}%\n"
-                f"[bold]Due for Review:[/bold] {stats['concepts_due_for_review']}",
-                title="Assessment Stats",
-                border_style="green",
             )
-        )
 
     run_async(show_stats())
 
@@ -680,25 +679,25 @@ def learner_delete(
     """Delete a learner profile."""
 
     async def delete():
-        db = get_db()
-        repo = LearnerRepository(db)
-
-        # Check if exists
-        if not await repo.exists(learner_id):
-            console.print(f"[red]Learner '{learner_id}' not found.[/red]")
-            raise typer.Exit(1)
-
-        if not force:
-            confirm = typer.confirm(f"Are you sure you want to delete learner '{learner_id}'?")
-            if not confirm:
-                console.print("[yellow]Cancelled.[/yellow]")
-                raise typer.Exit()
-
-        deleted = await repo.delete(learner_id)
-        if deleted:
-            console.print(f"[green]Deleted learner '{learner_id}'.[/green]")
-        else:
-            console.print(f"[red]Failed to delete learner '{learner_id}'.[/red]")
+        async with get_db() as db:
+            repo = LearnerRepository(db)
+
+            # Check if exists
+            if not await repo.exists(learner_id):
+                console.print(f"[red]Learner '{learner_id}' not found.[/red]")
+                raise typer.Exit(1)
+
+            if not force:
+                confirm = typer.confirm(f"Are you sure you want to delete learner '{learner_id}'?")
+                if not confirm:
+                    console.print("[yellow]Cancelled.[/yellow]")
+                    raise typer.Exit()
+
+            deleted = await repo.delete(learner_id)
+            if deleted:
+                console.print(f"[green]Deleted learner '{learner_id}'.[/green]")
+            else:
+                console.print(f"[red]Failed to delete learner '{learner_id}'.[/red]")
 
     run_async(delete())
 
@@ -71,12 +71,23 @@ class LessonLoader:
     _builtin_lessons: dict[str, list[Lesson]] = {}
     _custom_lessons: dict[str, list[Lesson]] = {}
 
+    # Derived views, rebuilt lazily after lessons are added
+    _grouped_cache: dict[str, list[tuple[str, list[Lesson]]]] = {}
+    _domains_cache: list[str] | None = None
+
+    @classmethod
+    def _invalidate(cls) -> None:
+        """Drop derived views after the set of lessons changes."""
+        cls._grouped_cache.clear()
+        cls._domains_cache = None
+
     @classmethod
     def register_builtin(cls, lesson: Lesson) -> None:
         """Register a built-in lesson."""
         if lesson.domain_id not in cls._builtin_lessons:
             cls._builtin_lessons[lesson.domain_id] = []
         cls._builtin_lessons[lesson.domain_id].append(lesson)
+        cls._invalidate()
 
     @classmethod
     def get_lessons(cls, domain_id: str) -> list[Lesson]:
@@ -98,12 +109,35 @@ class LessonLoader:
         """Get lessons filtered by category."""
         return [l for l in cls.get_lessons(domain_id) if l.category == category]
 
+    @classmethod
+    def get_lessons_grouped(cls, domain_id: str) -> list[tuple[str, list[Lesson]]]:
+        """Get a domain's lessons grouped by category.
+
+        Returns (category title, lessons) pairs, e.g. ("Fundamentals", [...]).
+        Categories are sorted by name and lessons within each category by
+        difficulty. The result is cached until more lessons are added, so
+        callers must not modify it.
+        """
+        grouped = cls._grouped_cache.get(domain_id)
+        if grouped is None:
+            categories: dict[str, list[Lesson]] = {}
+            for lesson in cls.get_lessons(domain_id):
+                categories.setdefault(lesson.category.value, []).append(lesson)
+            grouped = [
+                (category.title(), sorted(lessons, key=lambda x: x.difficulty))
+                for category, lessons in sorted(categories.items())
+            ]
+            cls._grouped_cache[domain_id] = grouped
+        return grouped
+
     @classmethod
     def list_domains_with_lessons(cls) -> list[str]:
         """List all domains that have lessons."""
-        domains = set(cls._builtin_lessons.keys())
-        domains.update(cls._custom_lessons.keys())
-        return sorted(domains)
+        if cls._domains_cache is None:
+            domains = set(cls._builtin_lessons.keys())
+            domains.update(cls._custom_lessons.keys())
+            cls._domains_cache = sorted(domains)
+        return list(cls._domains_cache)
 
     @classmethod
     def load_from_file(cls, path: Path) -> list[Lesson]:
@@ -121,4 +155,5 @@ class LessonLoader:
                 cls._custom_lessons[lesson.domain_id] = []
             cls._custom_lessons[lesson.domain_id].append(lesson)
 
+        cls._invalidate()
         return lessons
@@ -154,6 +154,41 @@ class AssessmentGrader:
         # For free response and others, use LLM
         return self._grade_with_llm(assessment, response)
 
+    async def agrade(
+        self,
+        assessment: Assessment,
+        response: str,
+        learner_id: str = "",
+    ) -> GradingResult:
+        """Grade a learner's response without blocking the event loop.
+
+        Async counterpart of grade(), for the REPL and GUI. Free responses
+        are graded with LLMClient.acomplete().
+
+        Args:
+            assessment: The assessment being answered
+            response: The learner's response text
+            learner_id: Optional learner identifier for tracking
+
+        Returns:
+            GradingResult with score, feedback, and analysis
+        """
+        if assessment.assessment_type == AssessmentType.MULTIPLE_CHOICE:
+            return self._grade_multiple_choice(assessment, response)
+
+        system_prompt, user_prompt = self._build_prompts(assessment, response)
+
+        try:
+            llm_response = await self.llm_client.acomplete(
+                user_message=user_prompt,
+                system_prompt=system_prompt,
+                temperature=0.3,  # Lower temperature for consistent grading
+            )
+
+            return self._parse_grading_response(llm_response.content)
+        except Exception as e:
+            return self._grading_error_result(e)
+
     def _grade_multiple_choice(
         self, assessment: Assessment, response: str
     ) -> GradingResult:
@@ -198,13 +233,7 @@ class AssessmentGrader:
         self, assessment: Assessment, response: str
     ) -> GradingResult:
         """Grade a free-response using LLM evaluation."""
-        bloom_info = self.BLOOM_CRITERIA.get(
-            assessment.bloom_level,
-            self.BLOOM_CRITERIA[BloomLevel.COMPREHENSION]
-        )
-
-        system_prompt = self._build_grading_prompt(assessment, bloom_info)
-        user_prompt = self._build_user_prompt(assessment, response)
+        system_prompt, user_prompt = self._build_prompts(assessment, response)
 
         try:
             llm_response = self.llm_client.complete(
@@ -215,13 +244,28 @@ class AssessmentGrader:
 
             return self._parse_grading_response(llm_response.content)
         except Exception as e:
-            # Fallback for API errors
-            return GradingResult(
-                score=0.5,
-                is_correct=False,
-                feedback=f"Unable to grade response automatically. Please review manually.",
-                grading_rationale=f"Grading error: {str(e)}",
-            )
+            return self._grading_error_result(e)
+
+    def _build_prompts(self, assessment: Assessment, response: str) -> tuple[str, str]:
+        """Build the (system, user) prompts for LLM grading."""
+        bloom_info = self.BLOOM_CRITERIA.get(
+            assessment.bloom_level,
+            self.BLOOM_CRITERIA[BloomLevel.COMPREHENSION]
+        )
+
+        system_prompt = self._build_grading_prompt(assessment, bloom_info)
+        user_prompt = self._build_user_prompt(assessment, response)
+        return system_prompt, user_prompt
+
+    @staticmethod
+    def _grading_error_result(error: Exception) -> GradingResult:
+        """Build the fallback result used when the LLM call fails."""
+        return GradingResult(
+            score=0.5,
+            is_correct=False,
+            feedback=f"Unable to grade response automatically. Please review manually.",
+            grading_rationale=f"Grading error: {str(error)}",
+        )
 
     def _build_grading_prompt(
         self, assessment: Assessment, bloom_info: dict
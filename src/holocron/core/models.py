@@ -90,7 +90,7 @@ class Concept:
     domain_data: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConceptMastery:
     """Tracks a learner's mastery of a single concept.
 
@@ -347,6 +347,29 @@ class LearnerProfile:
 
         return self.domain_mastery[domain_id][concept_id]
 
+    def get_masteries(
+        self, pairs: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], ConceptMastery]:
+        """Get or create mastery records for several concepts at once.
+
+        Args:
+            pairs: (domain_id, concept_id) tuples to look up
+
+        Returns:
+            Dictionary mapping each (domain_id, concept_id) to its ConceptMastery
+        """
+        masteries: dict[tuple[str, str], ConceptMastery] = {}
+        for domain_id, concept_id in pairs:
+            domain = self.domain_mastery.setdefault(domain_id, {})
+            mastery = domain.get(concept_id)
+            if mastery is None:
+                mastery = domain[concept_id] = ConceptMastery(
+                    concept_id=concept_id,
+                    learner_id=self.learner_id,
+                )
+            masteries[(domain_id, concept_id)] = mastery
+        return masteries
+
     def get_domain_overall_mastery(self, domain_id: str) -> float:
         """Calculate average mastery across all concepts in a domain.
 
@@ -49,10 +49,12 @@ class TransformResult:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True)
 class TransformConfig:
     """Configuration for content transformation.
 
+    Frozen so a single instance can be shared safely between calls.
+
     Attributes:
         include_assessments: Whether to generate assessments
         num_assessments: Number of assessments per concept
@@ -164,11 +166,14 @@ class ContentTransformer:
         else:
             concepts = all_concepts
 
-        # Get mastery for each concept
-        concept_mastery_pairs: list[tuple[Concept, ConceptMastery]] = []
-        for concept in concepts:
-            mastery = self.learner.get_mastery(self.domain_id, concept.concept_id)
-            concept_mastery_pairs.append((concept, mastery))
+        # Get mastery for all concepts in one lookup
+        masteries = self.learner.get_masteries(
+            [(self.domain_id, concept.concept_id) for concept in concepts]
+        )
+        concept_mastery_pairs: list[tuple[Concept, ConceptMastery]] = [
+            (concept, masteries[(self.domain_id, concept.concept_id)])
+            for concept in concepts
+        ]
 
         # Determine scaffold level
         if config.scaffold_level_override is not None:
@@ -13,6 +13,7 @@ See the reading.py and programming.py adapters for complete examples.
 """
 
 from dataclasses import field
+from functools import cached_property
 from typing import Any
 
 from holocron.core.models import (
@@ -38,7 +39,7 @@ class TemplateDomainAdapter(DomainAdapter):
     Example:
         ```python
         class MusicTheoryAdapter(TemplateDomainAdapter):
-            @property
+            @cached_property
             def config(self) -> DomainConfig:
                 return DomainConfig(
                     domain_id="music-theory",
@@ -53,9 +54,15 @@ class TemplateDomainAdapter(DomainAdapter):
                 # Extract musical concepts from content
                 ...
         ```
+
+    Note:
+        ``config`` is a ``cached_property`` so the ``DomainConfig`` is built
+        once per adapter instance. Subclasses should also use
+        ``cached_property`` (or return the same instance) since
+        ``extract_concepts`` reads ``self.config`` for every concept.
     """
 
-    @property
+    @cached_property
     def config(self) -> DomainConfig:
         """Return domain configuration.
 
@@ -106,8 +113,10 @@ class TemplateDomainAdapter(DomainAdapter):
         Returns:
             Preprocessed content
         """
-        # Example preprocessing
-        content = content.strip()
+        # Example preprocessing - only strip (and copy) when there is
+        # leading or trailing whitespace to remove
+        if content[:1].isspace() or content[-1:].isspace():
+            content = content.strip()
         # Add your preprocessing logic here
         return content
 
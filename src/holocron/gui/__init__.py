@@ -6,6 +6,14 @@ This package provides a modern web interface for Holocron:
 - components: Reusable UI components
 """
 
-from holocron.gui.app import run_gui
-
 __all__ = ["run_gui"]
+
+
+def __getattr__(name: str):
+    # Import the app lazily so submodules like native_launcher can be
+    # loaded without pulling in the whole application
+    if name == "run_gui":
+        from holocron.gui.app import run_gui
+
+        return run_gui
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,12 +13,30 @@ Note: NiceGUI has two modes:
 These modes are mutually exclusive - you cannot mix them.
 """
 
+import asyncio
+import functools
+import logging
+import time
+
 from holocron.core.models import LearnerProfile
+from holocron.core.transformer import ContentTransformer, TransformConfig
+from holocron.domains.registry import DomainRegistry
 from holocron.learner import Database, LearnerRepository, get_default_db_path
 
 # Ensure domains are loaded
 import holocron.domains  # noqa: F401
 
+logger = logging.getLogger(__name__)
+
+# Seconds a loaded learner profile is reused before re-reading the database
+LEARNER_CACHE_TTL = 30.0
+
+# Seconds dashboard stats and due-review rows are reused before re-querying
+QUERY_CACHE_TTL = 5.0
+
+# Seconds between background saves of a learner marked dirty
+SAVE_FLUSH_INTERVAL = 2.0
+
 
 class AppState:
     """Application state management."""
@@ -28,17 +46,50 @@ class AppState:
         self.repo: LearnerRepository | None = None
         self.current_learner: LearnerProfile | None = None
         self.current_domain: str = "reading-skills"
+        self._init_lock = asyncio.Lock()
+        # Held while the current learner is saved or mutated by a transform
+        self._learner_lock = asyncio.Lock()
+        self._initialized = False
+        self._learner_cache: dict[str, tuple[float, LearnerProfile]] = {}
+        self._query_cache: dict[tuple, tuple[float, object]] = {}
+        # Bumped by every save; results of queries that straddle one aren't cached
+        self._query_generation = 0
+        self._inflight: dict[tuple, asyncio.Task] = {}
+        self._dirty = False
+        self._flush_task: asyncio.Task | None = None
 
     async def initialize(self):
         """Initialize database connection."""
         self.db = Database(get_default_db_path())
         await self.db.initialize()
         self.repo = LearnerRepository(self.db)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def ensure_initialized(self):
+        """Initialize exactly once, even when pages render concurrently.
+
+        Cheap after the first call, so pages can await it unconditionally
+        before touching ``repo``.
+        """
+        if self._initialized:
+            return
+        async with self._init_lock:
+            if not self._initialized:
+                await self.initialize()
+                self._initialized = True
 
     async def get_learner(self, learner_id: str) -> LearnerProfile | None:
-        """Get or create a learner profile."""
-        if self.repo is None:
-            await self.initialize()
+        """Get or create a learner profile.
+
+        Profiles are cached for LEARNER_CACHE_TTL seconds so navigating
+        between pages doesn't reload the same learner every time.
+        """
+        cached = self._learner_cache.get(learner_id)
+        if cached is not None and time.monotonic() - cached[0] < LEARNER_CACHE_TTL:
+            return cached[1]
+
+        await self.ensure_initialized()
 
         learner = await self.repo.get(learner_id)
         if learner is None:
@@ -47,12 +98,150 @@ class AppState:
                 name=learner_id.replace("-", " ").title(),
             )
             await self.repo.save(learner)
+        self._learner_cache[learner_id] = (time.monotonic(), learner)
+        return learner
+
+    async def ensure_ready(self, learner_id: str = "default") -> LearnerProfile:
+        """Load a learner and make it the current learner.
+
+        This is the common preamble of every page. The database is
+        initialized on first use and the profile comes from the learner
+        cache when it is fresh.
+        """
+        learner = await self.get_learner(learner_id)
+        if self.current_learner is not learner:
+            self.current_learner = learner
         return learner
 
+    async def _cached_query(self, key: tuple, query):
+        """Return a cached query result, running ``query()`` on a miss.
+
+        Results are reused for QUERY_CACHE_TTL seconds and dropped whenever
+        a learner is saved. Concurrent misses for the same key share one
+        query instead of each hitting the database.
+        """
+        cached = self._query_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < QUERY_CACHE_TTL:
+            return cached[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run_query(key, query))
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._forget_inflight, key))
+        # Shield so one page being closed doesn't cancel the shared query
+        return await asyncio.shield(task)
+
+    def _forget_inflight(self, key: tuple, task: asyncio.Task) -> None:
+        """Drop a finished query, unless a newer one for the key replaced it."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    async def _run_query(self, key: tuple, query):
+        """Run a query and store its result in the query cache."""
+        await self.ensure_initialized()
+        generation = self._query_generation
+        result = await query()
+        if generation == self._query_generation:
+            self._query_cache[key] = (time.monotonic(), result)
+        return result
+
+    async def get_learner_stats(self, learner_id: str) -> dict:
+        """Get statistics for a learner, initializing the database if needed."""
+        return await self._cached_query(
+            ("stats", learner_id),
+            lambda: self.repo.get_learner_stats(learner_id),
+        )
+
+    async def get_due_review_rows(self, learner_id: str) -> list:
+        """Get due review rows for a learner, initializing the database if needed."""
+        return await self._cached_query(
+            ("due", learner_id),
+            lambda: self.repo.get_due_review_rows(learner_id),
+        )
+
+    async def transform(self, transformer: ContentTransformer, content: str, config: TransformConfig):
+        """Run a content transform in a worker thread.
+
+        Transforms update the learner's mastery records, so they hold the
+        learner lock and a background save never reads a half-updated
+        profile.
+        """
+        async with self._learner_lock:
+            return await asyncio.to_thread(transformer.transform, content, config)
+
     async def save_learner(self):
-        """Save current learner profile."""
-        if self.current_learner and self.repo:
-            await self.repo.save(self.current_learner)
+        """Save current learner profile.
+
+        Saves hold the learner lock, so the background flush, an explicit
+        save and a running transform can't interleave, without blocking
+        the event loop while one waits.
+        """
+        if self.current_learner:
+            await self.ensure_initialized()
+            async with self._learner_lock:
+                await self.repo.save(self.current_learner)
+            # Later callers must not join or reuse a query that predates the save
+            self._query_generation += 1
+            self._query_cache.clear()
+            self._inflight.clear()
+            # Write-through: the saved profile is now the freshest copy
+            self._learner_cache[self.current_learner.learner_id] = (
+                time.monotonic(),
+                self.current_learner,
+            )
+
+    def mark_dirty(self):
+        """Schedule the current learner to be saved on the next flush.
+
+        Repeated clicks between flushes result in a single write.
+        """
+        self._dirty = True
+
+    async def flush(self):
+        """Save the current learner if it has unsaved changes.
+
+        If the save fails the learner stays dirty, so the next flush
+        retries it.
+        """
+        if not self._dirty:
+            return
+        self._dirty = False
+        try:
+            await self.save_learner()
+        except BaseException:
+            self._dirty = True
+            raise
+
+    async def shutdown(self):
+        """Save pending changes and close the database connections.
+
+        The background flush is stopped first so it can't reopen
+        connections after the close, and the connections are closed even
+        if the final save fails.
+        """
+        task, self._flush_task = self._flush_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        try:
+            await self.flush()
+        finally:
+            if self.db is not None:
+                await self.db.close()
+
+    async def _flush_loop(self):
+        """Periodically persist learner changes marked with mark_dirty()."""
+        while True:
+            await asyncio.sleep(SAVE_FLUSH_INTERVAL)
+            try:
+                await self.flush()
+            except Exception:
+                # Keep flushing; the learner is still dirty and is retried
+                logger.exception("Background learner save failed")
 
 
 # Global state instance
@@ -87,10 +276,15 @@ def run_gui(
 def _run_web_ui(app, ui, state, host: str, port: int, reload: bool):
     """Run in web mode with multi-page support."""
     # Import pages module to register routes
-    from holocron.gui.pages import register_pages
+    from holocron.gui.pages import register_pages, warm_caches
 
     # Configure app startup (do NOT call ui.colors here - it triggers script mode)
-    app.on_startup(state.initialize)
+    app.on_startup(state.ensure_initialized)
+    app.on_shutdown(state.shutdown)
+    if not reload:
+        # Without hot reload the process is long-lived, so warm page caches
+        # at startup instead of on the first visit
+        app.on_startup(warm_caches)
 
     # Register all page routes (colors are set inside pages)
     register_pages(state, ui)
@@ -111,10 +305,12 @@ def _run_native_ui(app, ui, state, host: str, port: int):
     In script mode, we build UI directly (no @ui.page decorators).
     Uses ui.timer for async data loading since app.on_startup is not available.
     """
-    from holocron.domains.registry import DomainRegistry
-
     ui.colors(primary="#3b82f6", secondary="#8b5cf6", accent="#f59e0b")
 
+    # Save pending changes and close pooled connections, whose worker
+    # threads would otherwise keep the process alive after the window closes
+    app.on_shutdown(state.shutdown)
+
     # Header
     with ui.header().classes("bg-primary text-white items-center"):
         with ui.row().classes("items-center gap-4"):
@@ -161,11 +357,10 @@ def _run_native_ui(app, ui, state, host: str, port: int):
                         ui.notify("Enter content first", type="warning")
                         return
 
-                    from holocron.core.transformer import ContentTransformer, TransformConfig
-
                     current_learner = await state.get_learner("default")
                     transformer = ContentTransformer(domain_id=domain_select.value, learner=current_learner)
-                    result = transformer.transform(content_area.value, TransformConfig())
+                    # Run extraction off the event loop so the UI keeps painting
+                    result = await state.transform(transformer, content_area.value, TransformConfig())
 
                     results.clear()
                     with results:
@@ -183,10 +378,11 @@ def _run_native_ui(app, ui, state, host: str, port: int):
 
     # Load data asynchronously using timer (runs once after UI is ready)
     async def load_data():
-        await state.initialize()
-        learner = await state.get_learner("default")
+        learner, stats = await asyncio.gather(
+            state.get_learner("default"),
+            state.get_learner_stats("default"),
+        )
         state.current_learner = learner
-        stats = await state.repo.get_learner_stats(learner.learner_id)
 
         # Update UI elements with loaded data
         welcome_label.set_text(f"Welcome, {learner.name}!")
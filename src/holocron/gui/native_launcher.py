@@ -5,17 +5,27 @@ This script runs Holocron in native desktop mode using pywebview.
 Run directly with: python -m holocron.gui.native_launcher
 """
 
-import argparse
+import sys
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
 
 
 def main():
-    parser = argparse.ArgumentParser(description="Holocron Native GUI")
-    parser.add_argument("--host", default="127.0.0.1", help="Host to bind to")
-    parser.add_argument("--port", type=int, default=8080, help="Port to run on")
-    args = parser.parse_args()
+    host, port = DEFAULT_HOST, DEFAULT_PORT
+
+    # Only build an argument parser when there are arguments to parse
+    if len(sys.argv) > 1:
+        import argparse
+
+        parser = argparse.ArgumentParser(description="Holocron Native GUI")
+        parser.add_argument("--host", default=DEFAULT_HOST, help="Host to bind to")
+        parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port to run on")
+        args = parser.parse_args()
+        host, port = args.host, args.port
 
     from holocron.gui.app import run_gui
-    run_gui(host=args.host, port=args.port, native=True)
+    run_gui(host=host, port=port, native=True)
 
 
 if __name__ == "__main__":
@@ -4,12 +4,219 @@ This module contains the @ui.page decorated routes.
 Only import this module when running in web (non-native) mode.
 """
 
+import asyncio
+import codecs
+import functools
+import html
+import io
+
 from nicegui import ui
 
 from holocron.config import get_settings
 from holocron.content import LessonLoader, LessonCategory
+from holocron.core.models import BloomLevel
+from holocron.core.transformer import ContentTransformer, TransformConfig
 from holocron.domains.registry import DomainRegistry
 
+# Ensure domains are loaded
+import holocron.domains  # noqa: F401
+
+# Bytes read per chunk when decoding uploaded files
+_UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Transform settings used by the study page's "Start Studying" button
+_DEFAULT_STUDY_CONFIG = TransformConfig(
+    include_assessments=True,
+    num_assessments=1,
+    assessment_bloom_levels=[BloomLevel.KNOWLEDGE, BloomLevel.COMPREHENSION],
+)
+
+# Tailwind classes shared by every page
+_PAGE_CLS = "w-full max-w-4xl mx-auto p-6 gap-6"
+_WIDE_PAGE_CLS = "w-full max-w-6xl mx-auto p-6 gap-6"
+_PAGE_TITLE_CLS = "text-2xl font-bold"
+_SECTION_TITLE_CLS = "font-bold text-lg"
+
+# Dashboard stat cards: (icon, icon color, stats key, caption)
+_DASHBOARD_STATS = (
+    ("schedule", "primary", "total_study_time_minutes", "Minutes Studied"),
+    ("local_fire_department", "orange", "current_streak_days", "Day Streak"),
+    ("emoji_events", "green", "concepts_mastered", "Concepts Mastered"),
+    ("replay", "purple", "concepts_due_for_review", "Due for Review"),
+)
+
+# Quasar classes for an outlined ui.badge, for badges rendered as raw HTML
+_OUTLINE_BADGE_CLS = "q-badge q-badge--outline"
+
+# Static part of the review page's "nothing due" card
+_EMPTY_REVIEW_HTML = (
+    '<div class="flex flex-col items-center gap-4">'
+    '<i class="q-icon notranslate material-icons text-green" style="font-size: 6rem">check_circle</i>'
+    '<div class="text-xl font-bold">All caught up!</div>'
+    '<div class="text-gray-500">No concepts due for review.</div>'
+    "</div>"
+)
+
+# Header navigation: (label, route). Entries are plain links, so navigating
+# doesn't need a click event round-trip
+_NAV_ITEMS = (
+    ("Dashboard", "/"),
+    ("Lessons", "/lessons"),
+    ("Study", "/study"),
+    ("Review", "/review"),
+    ("Settings", "/settings"),
+)
+
+# Classes for header navigation links
+_NAV_LINK_CLS = "text-white no-underline font-medium uppercase px-2"
+
+# Number of concepts rendered per "Show more" page on the study page
+_CONCEPT_PAGE_SIZE = 15
+
+# Number of due concepts per page of the review table
+_REVIEW_PAGE_SIZE = 10
+
+# Columns of the review page's due-concept table
+_REVIEW_TABLE_COLUMNS = [
+    {"name": "name", "label": "Concept", "field": "name", "align": "left"},
+    {"name": "domain", "label": "Domain", "field": "domain", "align": "left"},
+    {"name": "mastery", "label": "Mastery", "field": "mastery", "align": "right"},
+]
+
+@functools.cache
+def _cached_domain_rows() -> tuple[tuple[str, str, str], ...]:
+    """Return (domain_id, display_name, description) for every domain.
+
+    Registered domains don't change at runtime, so the rows are built on
+    first use and reused by every page.
+    """
+    rows = []
+    for domain_id in DomainRegistry.list_domains():
+        config = DomainRegistry.get(domain_id).config
+        rows.append((domain_id, config.display_name, config.description))
+    return tuple(rows)
+
+
+@functools.cache
+def _domain_select_options() -> dict[str, str]:
+    """Return the domain select options, built once and shared by all pages.
+
+    NiceGUI doesn't modify select options unless new values are allowed,
+    so the same mapping can back every study page's domain select.
+    """
+    return {domain_id: display_name for domain_id, display_name, _ in _cached_domain_rows()}
+
+
+def _go_to(route: str) -> None:
+    """Navigate the current client to a route."""
+    ui.navigate.to(route)
+
+
+# Shared click handlers, so buttons don't each allocate a navigation lambda
+_go_study = functools.partial(_go_to, "/study")
+_go_review = functools.partial(_go_to, "/review")
+_go_lessons = functools.partial(_go_to, "/lessons")
+
+
+def _notify_review_start() -> None:
+    """Tell the user a review session is starting."""
+    ui.notify("Starting review...", type="info")
+
+
+async def _await_after_connect(query: asyncio.Future):
+    """Wait for the client to connect, then return the query's result.
+
+    If the client never connects the query is cancelled (or its error
+    consumed, if it already failed), so it isn't left running with nobody
+    to observe its result or error.
+    """
+    try:
+        await ui.context.client.connected()
+        return await query
+    finally:
+        if not query.cancel() and not query.cancelled():
+            query.exception()
+
+
+def _decode_upload(stream) -> str:
+    """Read and decode an uploaded UTF-8 file.
+
+    Decodes in chunks so large files aren't held as bytes and str at once.
+    """
+    buffer = io.StringIO()
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    while chunk := stream.read(_UPLOAD_CHUNK_SIZE):
+        buffer.write(decoder.decode(chunk))
+    buffer.write(decoder.decode(b"", final=True))
+    return buffer.getvalue()
+
+
+def _stat_card_html(icon: str, color: str, value, caption: str) -> str:
+    """Render the inside of a dashboard stat card as HTML."""
+    return (
+        '<div class="flex flex-col items-center p-4">'
+        f'<i class="q-icon notranslate material-icons text-{color}" style="font-size: 3rem">{icon}</i>'
+        f'<div class="text-3xl font-bold">{value}</div>'
+        f'<div class="text-gray-500">{caption}</div>'
+        "</div>"
+    )
+
+
+def _stat_card(icon: str, color: str, caption: str) -> ui.html:
+    """Add a dashboard stat card showing 0 and return its content element.
+
+    The icon, value and caption are a single ui.html element, so a card
+    costs two elements instead of five and updates with one set_content().
+    """
+    with ui.card().classes("flex-1"):
+        return ui.html(_stat_card_html(icon, color, 0, caption))
+
+
+def _concept_cards_html(concepts) -> str:
+    """Render concept cards as a single HTML string.
+
+    One ui.html element replaces a card/row/label/badge per concept,
+    which keeps element creation and websocket traffic constant.
+    """
+    cards = "".join(
+        '<div class="q-card w-full mb-2 p-4 flex items-center justify-between">'
+        f'<span class="font-semibold">{html.escape(concept.name)}</span>'
+        '<span class="q-badge bg-primary text-white">'
+        f"Difficulty: {concept.difficulty_score}/10</span>"
+        "</div>"
+        for concept in concepts
+    )
+    return f'<div class="w-full">{cards}</div>'
+
+
+@functools.cache
+def _domain_display_name(domain_id: str) -> str:
+    """Return a domain's display name, prettifying IDs of unregistered domains."""
+    return _domain_select_options().get(domain_id) or domain_id.replace("-", " ").title()
+
+
+def warm_caches() -> None:
+    """Populate the page-level caches before the first request.
+
+    Instantiates the domain adapters and builds the shared domain rows and
+    select options so the first visitor doesn't pay for them.
+    """
+    _cached_domain_rows()
+    _domain_select_options()
+
+
+def _lesson_badges_html(lesson) -> str:
+    """Render a lesson card's duration, difficulty and tag badges as HTML."""
+    badges = [
+        f'<span class="{_OUTLINE_BADGE_CLS}">~{lesson.estimated_minutes} min</span>',
+        f'<span class="{_OUTLINE_BADGE_CLS}">Difficulty: {lesson.difficulty}/10</span>',
+    ]
+    badges.extend(
+        f'<span class="{_OUTLINE_BADGE_CLS} text-primary">{html.escape(tag)}</span>'
+        for tag in lesson.tags[:3]
+    )
+    return f'<div class="flex gap-2 mt-1">{"".join(badges)}</div>'
+
 
 def register_pages(state, ui_module=None):
     """Register all page routes with the given state.
@@ -21,6 +228,9 @@ def register_pages(state, ui_module=None):
     # Set colors inside a page to avoid triggering script mode
     # Colors will be applied when the first page loads
 
+    # Settings are fixed for the life of the process; resolve them once
+    settings = get_settings()
+
     def create_header():
         """Create the application header."""
         with ui.header().classes("bg-primary text-white items-center justify-between"):
@@ -29,11 +239,8 @@ def register_pages(state, ui_module=None):
                 ui.label("Holocron").classes("text-xl font-bold")
 
             with ui.row().classes("gap-2"):
-                ui.button("Dashboard", on_click=lambda: ui.navigate.to("/")).props("flat")
-                ui.button("Lessons", on_click=lambda: ui.navigate.to("/lessons")).props("flat")
-                ui.button("Study", on_click=lambda: ui.navigate.to("/study")).props("flat")
-                ui.button("Review", on_click=lambda: ui.navigate.to("/review")).props("flat")
-                ui.button("Settings", on_click=lambda: ui.navigate.to("/settings")).props("flat")
+                for label, route in _NAV_ITEMS:
+                    ui.link(label, route).classes(_NAV_LINK_CLS)
 
     def create_footer():
         """Create the application footer."""
@@ -45,57 +252,54 @@ def register_pages(state, ui_module=None):
         """Main dashboard page."""
         # Set colors on first page load (safe inside @ui.page)
         ui.colors(primary="#3b82f6", secondary="#8b5cf6", accent="#f59e0b")
-        create_header()
-
-        learner = await state.get_learner("default")
-        state.current_learner = learner
 
-        if state.repo is None:
-            await state.initialize()
+        create_header()
 
-        stats = await state.repo.get_learner_stats(learner.learner_id)
+        learner = await state.ensure_ready()
 
-        with ui.column().classes("w-full max-w-6xl mx-auto p-6 gap-6"):
-            ui.label(f"Welcome back, {learner.name}!").classes("text-2xl font-bold")
+        # Build the page with placeholder values first; stats are filled in
+        # once the browser has the page (see client.connected() below)
+        with ui.column().classes(_WIDE_PAGE_CLS):
+            ui.label(f"Welcome back, {learner.name}!").classes(_PAGE_TITLE_CLS)
 
             with ui.row().classes("w-full gap-4"):
-                with ui.card().classes("flex-1"):
-                    with ui.column().classes("items-center p-4"):
-                        ui.icon("schedule", size="xl", color="primary")
-                        ui.label(f"{stats.get('total_study_time_minutes', 0)}").classes("text-3xl font-bold")
-                        ui.label("Minutes Studied").classes("text-gray-500")
-
-                with ui.card().classes("flex-1"):
-                    with ui.column().classes("items-center p-4"):
-                        ui.icon("local_fire_department", size="xl", color="orange")
-                        ui.label(f"{stats.get('current_streak_days', 0)}").classes("text-3xl font-bold")
-                        ui.label("Day Streak").classes("text-gray-500")
-
-                with ui.card().classes("flex-1"):
-                    with ui.column().classes("items-center p-4"):
-                        ui.icon("emoji_events", size="xl", color="green")
-                        ui.label(f"{stats.get('concepts_mastered', 0)}").classes("text-3xl font-bold")
-                        ui.label("Concepts Mastered").classes("text-gray-500")
-
-                with ui.card().classes("flex-1"):
-                    with ui.column().classes("items-center p-4"):
-                        ui.icon("replay", size="xl", color="purple")
-                        ui.label(f"{stats.get('concepts_due_for_review', 0)}").classes("text-3xl font-bold")
-                        ui.label("Due for Review").classes("text-gray-500")
-
-            accuracy = stats.get("accuracy", 0)
+                stat_cards = [
+                    (_stat_card(icon, color, caption), icon, color, key, caption)
+                    for icon, color, key, caption in _DASHBOARD_STATS
+                ]
+
             with ui.card().classes("w-full"):
                 with ui.column().classes("p-4 gap-2"):
                     ui.label("Assessment Accuracy").classes("font-bold")
                     with ui.row().classes("w-full items-center gap-2"):
-                        ui.linear_progress(value=accuracy / 100, show_value=False).classes("flex-1")
-                        ui.label(f"{accuracy:.0f}%").classes("font-bold")
+                        accuracy_bar = ui.linear_progress(value=0, show_value=False).classes("flex-1")
+                        accuracy_label = ui.label("0%").classes("font-bold")
 
-            domains = stats.get("domains", {})
-            if domains:
+            domain_container = ui.column().classes("w-full")
+
+            with ui.row().classes("w-full gap-4 mt-4"):
+                ui.button("Start Studying", icon="menu_book", on_click=_go_study).classes("flex-1").props("color=primary size=lg")
+                ui.button("Review Due Concepts", icon="replay", on_click=_go_review).classes("flex-1").props("color=secondary size=lg")
+
+        create_footer()
+
+        # Stats only need the learner ID, so query them while the page above
+        # is sent to the browser
+        stats = await _await_after_connect(asyncio.ensure_future(state.get_learner_stats("default")))
+
+        for card, icon, color, key, caption in stat_cards:
+            card.set_content(_stat_card_html(icon, color, stats.get(key, 0), caption))
+
+        accuracy = stats.get("accuracy", 0)
+        accuracy_bar.set_value(accuracy / 100)
+        accuracy_label.set_text(f"{accuracy:.0f}%")
+
+        domains = stats.get("domains", {})
+        if domains:
+            with domain_container:
                 with ui.card().classes("w-full"):
                     with ui.column().classes("p-4 gap-4"):
-                        ui.label("Domain Progress").classes("font-bold text-lg")
+                        ui.label("Domain Progress").classes(_SECTION_TITLE_CLS)
                         for domain_id, domain_stats in domains.items():
                             with ui.row().classes("w-full items-center gap-4"):
                                 ui.label(domain_id).classes("w-48")
@@ -103,26 +307,18 @@ def register_pages(state, ui_module=None):
                                     ui.linear_progress(value=domain_stats["avg_mastery"] / 100, show_value=False).classes("w-full")
                                     ui.label(f"{domain_stats['concept_count']} concepts, {domain_stats['avg_mastery']:.0f}% avg mastery").classes("text-sm text-gray-500")
 
-            with ui.row().classes("w-full gap-4 mt-4"):
-                ui.button("Start Studying", icon="menu_book", on_click=lambda: ui.navigate.to("/study")).classes("flex-1").props("color=primary size=lg")
-                ui.button("Review Due Concepts", icon="replay", on_click=lambda: ui.navigate.to("/review")).classes("flex-1").props("color=secondary size=lg")
-
-        create_footer()
-
     @ui.page("/study")
     async def study_page():
         """Study mode page."""
         create_header()
 
-        learner = await state.get_learner("default")
-        state.current_learner = learner
+        learner = await state.ensure_ready()
 
-        with ui.column().classes("w-full max-w-4xl mx-auto p-6 gap-6"):
-            ui.label("Study Mode").classes("text-2xl font-bold")
+        with ui.column().classes(_PAGE_CLS):
+            ui.label("Study Mode").classes(_PAGE_TITLE_CLS)
 
-            domains = DomainRegistry.list_domains()
             domain_select = ui.select(
-                options=domains,
+                options=_domain_select_options(),
                 value=state.current_domain,
                 label="Select Domain",
                 on_change=lambda e: setattr(state, "current_domain", e.value),
@@ -134,8 +330,8 @@ def register_pages(state, ui_module=None):
             ui.label("Or upload a file:").classes("font-semibold mt-2")
 
             async def handle_upload(e):
-                content = e.content.read().decode("utf-8")
-                content_area.value = content
+                # Decoding a large file can take a while; keep it off the event loop
+                content_area.value = await asyncio.to_thread(_decode_upload, e.content)
 
             ui.upload(on_upload=handle_upload, auto_upload=True).classes("w-full").props('accept=".txt,.md,.py"')
 
@@ -148,37 +344,50 @@ def register_pages(state, ui_module=None):
                     return
 
                 results_container.clear()
+                with results_container:
+                    ui.spinner(size="lg")
 
-                from holocron.core.transformer import ContentTransformer, TransformConfig
-                from holocron.core.models import BloomLevel
-
-                transformer = ContentTransformer(domain_id=state.current_domain, learner=learner)
-                config = TransformConfig(
-                    include_assessments=True,
-                    num_assessments=1,
-                    assessment_bloom_levels=[BloomLevel.KNOWLEDGE, BloomLevel.COMPREHENSION],
-                )
-                result = transformer.transform(content, config)
+                # Read the select directly; the debounced state update may be pending
+                transformer = ContentTransformer(domain_id=domain_select.value, learner=learner)
+                # Transform is synchronous; keep it off the event loop
+                result = await state.transform(transformer, content, _DEFAULT_STUDY_CONFIG)
 
+                results_container.clear()
                 with results_container:
                     if not result.concepts_found:
                         ui.label("No concepts found in this content.").classes("text-yellow-600")
                         return
 
-                    ui.label(f"Found {len(result.concepts_found)} concepts").classes("font-bold text-lg")
+                    ui.label(f"Found {len(result.concepts_found)} concepts").classes(_SECTION_TITLE_CLS)
+
+                    concepts = result.concepts_found
+                    shown = _CONCEPT_PAGE_SIZE
 
                     with ui.expansion("View Concepts", icon="lightbulb").classes("w-full"):
-                        for concept in result.concepts_found[:15]:
-                            with ui.card().classes("w-full mb-2"):
-                                with ui.row().classes("items-center justify-between"):
-                                    ui.label(concept.name).classes("font-semibold")
-                                    ui.badge(f"Difficulty: {concept.difficulty_score}/10")
+                        concept_list = ui.column().classes("w-full gap-0")
+                        with concept_list:
+                            ui.html(_concept_cards_html(concepts[:shown])).classes("w-full")
+
+                        def show_more():
+                            # Append the next page rather than re-rendering the list
+                            nonlocal shown
+                            with concept_list:
+                                ui.html(_concept_cards_html(concepts[shown:shown + _CONCEPT_PAGE_SIZE])).classes("w-full")
+                            shown += _CONCEPT_PAGE_SIZE
+                            if shown >= len(concepts):
+                                more_button.delete()
+
+                        if len(concepts) > shown:
+                            more_button = ui.button("Show more", icon="expand_more", on_click=show_more).props("flat")
 
                     if result.assessments:
                         ui.label(f"Generated {len(result.assessments)} assessments").classes("font-bold text-lg mt-4")
 
-                await state.save_learner()
-                ui.notify(f"Studied {len(result.concepts_found)} concepts!", type="positive")
+                state.mark_dirty()
+                ui.notify(
+                    f"Studied {len(result.concepts_found)} concepts! Your progress will be saved shortly.",
+                    type="positive",
+                )
 
             ui.button("Start Studying", icon="play_arrow", on_click=start_study).classes("mt-4").props("color=primary size=lg")
 
@@ -189,75 +398,97 @@ def register_pages(state, ui_module=None):
         """Spaced repetition review page."""
         create_header()
 
-        learner = await state.get_learner("default")
-        state.current_learner = learner
-
-        if state.repo is None:
-            await state.initialize()
+        with ui.column().classes(_PAGE_CLS) as page_column:
+            ui.label("Review Mode").classes(_PAGE_TITLE_CLS)
 
-        with ui.column().classes("w-full max-w-4xl mx-auto p-6 gap-6"):
-            ui.label("Review Mode").classes("text-2xl font-bold")
+        create_footer()
 
-            due_concepts = await state.repo.get_concepts_due_for_review(learner.learner_id)
+        # Send the header and title to the browser while the profile and the
+        # due rows (which only need the learner ID) load together
+        _, due_concepts = await _await_after_connect(
+            asyncio.gather(
+                state.ensure_ready(),
+                state.get_due_review_rows("default"),
+            )
+        )
 
+        with page_column:
             if not due_concepts:
                 with ui.card().classes("w-full"):
                     with ui.column().classes("items-center p-8 gap-4"):
-                        ui.icon("check_circle", size="6rem", color="green")
-                        ui.label("All caught up!").classes("text-xl font-bold")
-                        ui.label("No concepts due for review.").classes("text-gray-500")
-                        ui.button("Go Study New Content", icon="menu_book", on_click=lambda: ui.navigate.to("/study")).props("color=primary")
+                        ui.html(_EMPTY_REVIEW_HTML)
+                        ui.button("Go Study New Content", icon="menu_book", on_click=_go_study).props("color=primary")
             else:
                 ui.label(f"{len(due_concepts)} concepts due for review").classes("text-gray-600")
 
-                for domain_id, concept_id in due_concepts[:10]:
-                    mastery = learner.get_mastery(domain_id, concept_id)
-                    with ui.card().classes("w-full"):
-                        with ui.row().classes("items-center justify-between"):
-                            with ui.column():
-                                ui.label(concept_id.split(".")[-1].replace("_", " ").title()).classes("font-semibold")
-                                ui.label(f"Domain: {domain_id}").classes("text-sm text-gray-500")
-                            with ui.column().classes("items-end"):
-                                ui.label(f"Mastery: {mastery.overall_mastery:.0f}%").classes("font-bold")
-
-                ui.button("Start Review Session", icon="replay", on_click=lambda: ui.notify("Starting review...", type="info")).classes("mt-4").props("color=primary size=lg")
-
-        create_footer()
+                # One table element with client-side paging instead of a card per concept
+                ui.table(
+                    columns=_REVIEW_TABLE_COLUMNS,
+                    rows=[
+                        {
+                            "id": f"{row.domain_id}:{row.concept_id}",
+                            "name": row.display_name,
+                            "domain": row.domain_id,
+                            "mastery": f"{row.mastery_pct:.0f}%",
+                        }
+                        for row in due_concepts
+                    ],
+                    row_key="id",
+                    pagination=_REVIEW_PAGE_SIZE,
+                ).classes("w-full")
+
+                ui.button("Start Review Session", icon="replay", on_click=_notify_review_start).classes("mt-4").props("color=primary size=lg")
 
     @ui.page("/settings")
     async def settings_page():
         """Settings page."""
         create_header()
 
-        learner = await state.get_learner("default")
-        state.current_learner = learner
-        settings = get_settings()
+        learner = await state.ensure_ready()
 
-        with ui.column().classes("w-full max-w-4xl mx-auto p-6 gap-6"):
-            ui.label("Settings").classes("text-2xl font-bold")
+        with ui.column().classes(_PAGE_CLS):
+            ui.label("Settings").classes(_PAGE_TITLE_CLS)
 
             with ui.card().classes("w-full"):
                 with ui.column().classes("p-4 gap-4"):
-                    ui.label("Profile Settings").classes("font-bold text-lg")
+                    ui.label("Profile Settings").classes(_SECTION_TITLE_CLS)
                     name_input = ui.input("Name", value=learner.name).classes("w-full")
                     daily_goal = ui.number("Daily Goal (minutes)", value=learner.preferences.daily_goal_minutes, min=5, max=120).classes("w-full")
 
                     async def save_profile():
                         learner.name = name_input.value
                         learner.preferences.daily_goal_minutes = int(daily_goal.value)
-                        await state.save_learner()
+                        # An explicit save is awaited so the notice reflects the outcome
+                        state.mark_dirty()
+                        try:
+                            await state.flush()
+                        except Exception as e:
+                            ui.notify(f"Could not save profile: {e}", type="negative")
+                            return
                         ui.notify("Profile saved!", type="positive")
 
                     ui.button("Save Profile", icon="save", on_click=save_profile).props("color=primary")
 
             with ui.card().classes("w-full"):
                 with ui.column().classes("p-4 gap-4"):
-                    ui.label("Available Domains").classes("font-bold text-lg")
-                    for domain_id in DomainRegistry.list_domains():
-                        adapter = DomainRegistry.get(domain_id)
+                    ui.label("Available Domains").classes(_SECTION_TITLE_CLS)
+                    for _, display_name, _ in _cached_domain_rows():
                         with ui.row().classes("items-center gap-2"):
                             ui.icon("folder", color="primary")
-                            ui.label(adapter.config.display_name).classes("font-semibold")
+                            ui.label(display_name).classes("font-semibold")
+
+            with ui.card().classes("w-full"):
+                with ui.column().classes("p-4 gap-4"):
+                    ui.label("API Keys").classes(_SECTION_TITLE_CLS)
+                    api_keys = [
+                        (settings.gemini_api_key, "Gemini"),
+                        (settings.openai_api_key, "OpenAI"),
+                        (settings.anthropic_api_key, "Anthropic"),
+                    ]
+                    # One label for all providers instead of a label per key
+                    ui.label(
+                        "\n".join(f"{name}: {'✓ Set' if key else '✗ Not set'}" for key, name in api_keys)
+                    ).classes("whitespace-pre-line")
 
         create_footer()
 
@@ -266,11 +497,10 @@ def register_pages(state, ui_module=None):
         """Lesson browser page."""
         create_header()
 
-        learner = await state.get_learner("default")
-        state.current_learner = learner
+        learner = await state.ensure_ready()
 
-        with ui.column().classes("w-full max-w-6xl mx-auto p-6 gap-6"):
-            ui.label("Lessons").classes("text-2xl font-bold")
+        with ui.column().classes(_WIDE_PAGE_CLS):
+            ui.label("Lessons").classes(_PAGE_TITLE_CLS)
             ui.label("Choose a lesson to start learning").classes("text-gray-600")
 
             # Get all domains with lessons
@@ -281,38 +511,22 @@ def register_pages(state, ui_module=None):
                 if not lessons:
                     continue
 
-                # Get domain display name
-                try:
-                    adapter = DomainRegistry.get(domain_id)
-                    domain_name = adapter.config.display_name
-                except KeyError:
-                    domain_name = domain_id.replace("-", " ").title()
+                domain_name = _domain_display_name(domain_id)
 
                 with ui.expansion(f"{domain_name} ({len(lessons)} lessons)", icon="folder").classes("w-full"):
-                    # Group by category
-                    categories = {}
-                    for lesson in lessons:
-                        cat = lesson.category.value
-                        if cat not in categories:
-                            categories[cat] = []
-                        categories[cat].append(lesson)
-
-                    for category, cat_lessons in sorted(categories.items()):
-                        ui.label(category.title()).classes("font-semibold text-lg mt-4 mb-2")
-
-                        for lesson in sorted(cat_lessons, key=lambda x: x.difficulty):
+                    # Grouped by category and sorted by difficulty (cached)
+                    for category_title, cat_lessons in LessonLoader.get_lessons_grouped(domain_id):
+                        ui.label(category_title).classes("font-semibold text-lg mt-4 mb-2")
+
+                        for lesson in cat_lessons:
                             with ui.card().classes("w-full mb-2 cursor-pointer hover:bg-gray-50").on(
-                                "click", lambda l=lesson: ui.navigate.to(f"/lesson/{l.domain_id}/{l.lesson_id}")
+                                "click", functools.partial(_go_to, f"/lesson/{lesson.domain_id}/{lesson.lesson_id}")
                             ):
                                 with ui.row().classes("items-center justify-between p-4"):
                                     with ui.column().classes("gap-1"):
                                         ui.label(lesson.title).classes("font-semibold text-lg")
                                         ui.label(lesson.description).classes("text-gray-600 text-sm")
-                                        with ui.row().classes("gap-2 mt-1"):
-                                            ui.badge(f"~{lesson.estimated_minutes} min").props("outline")
-                                            ui.badge(f"Difficulty: {lesson.difficulty}/10").props("outline")
-                                            for tag in lesson.tags[:3]:
-                                                ui.badge(tag, color="primary").props("outline")
+                                        ui.html(_lesson_badges_html(lesson))
                                     ui.icon("chevron_right", size="lg", color="gray")
 
         create_footer()
@@ -322,21 +536,20 @@ def register_pages(state, ui_module=None):
         """Individual lesson page."""
         create_header()
 
-        learner = await state.get_learner("default")
-        state.current_learner = learner
+        learner = await state.ensure_ready()
 
         lesson = LessonLoader.get_lesson(domain_id, lesson_id)
 
-        with ui.column().classes("w-full max-w-4xl mx-auto p-6 gap-6"):
+        with ui.column().classes(_PAGE_CLS):
             if not lesson:
                 ui.label("Lesson not found").classes("text-2xl font-bold text-red-600")
-                ui.button("Back to Lessons", on_click=lambda: ui.navigate.to("/lessons")).props("color=primary")
+                ui.button("Back to Lessons", on_click=_go_lessons).props("color=primary")
             else:
                 # Lesson header
                 with ui.row().classes("items-center gap-4 mb-4"):
-                    ui.button(icon="arrow_back", on_click=lambda: ui.navigate.to("/lessons")).props("flat round")
+                    ui.button(icon="arrow_back", on_click=_go_lessons).props("flat round")
                     with ui.column().classes("gap-1"):
-                        ui.label(lesson.title).classes("text-2xl font-bold")
+                        ui.label(lesson.title).classes(_PAGE_TITLE_CLS)
                         ui.label(lesson.description).classes("text-gray-600")
 
                 # Lesson metadata
@@ -352,13 +565,17 @@ def register_pages(state, ui_module=None):
 
                 # Study button
                 async def study_lesson():
-                    from holocron.core.transformer import ContentTransformer, TransformConfig
-
                     transformer = ContentTransformer(domain_id=domain_id, learner=learner)
-                    result = transformer.transform(lesson.content, TransformConfig(include_assessments=True))
-
-                    await state.save_learner()
-                    ui.notify(f"Studied {len(result.concepts_found)} concepts from this lesson!", type="positive")
+                    result = await state.transform(
+                        transformer, lesson.content, TransformConfig(include_assessments=True)
+                    )
+
+                    state.mark_dirty()
+                    ui.notify(
+                        f"Studied {len(result.concepts_found)} concepts from this lesson! "
+                        "Your progress will be saved shortly.",
+                        type="positive",
+                    )
 
                 with ui.row().classes("gap-4 mt-4"):
                     ui.button("Mark as Studied", icon="check", on_click=study_lesson).props("color=primary size=lg")
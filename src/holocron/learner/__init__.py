@@ -8,12 +8,16 @@ This package handles learner profiles and persistence:
 
 from holocron.learner.database import (
     Database,
+    DueReviewRow,
     LearnerRepository,
+    LearnerSummary,
     get_default_db_path,
 )
 
 __all__ = [
     "Database",
+    "DueReviewRow",
     "LearnerRepository",
+    "LearnerSummary",
     "get_default_db_path",
 ]
@@ -10,12 +10,16 @@ The database schema stores:
 - Learning session logs
 """
 
+import asyncio
+import functools
 import json
 import sqlite3
+from collections import OrderedDict
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, AsyncGenerator
+from typing import Any, AsyncGenerator, Iterable
 
 import aiosqlite
 
@@ -33,6 +37,134 @@ def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+@dataclass
+class LearnerSummary:
+    """The listing fields of a learner profile.
+
+    Attributes:
+        learner_id: The learner's unique identifier
+        name: Display name
+        created_at: When the profile was created
+        total_study_time_minutes: Total time studied
+        concepts_mastered: Number of mastered concepts
+        current_streak_days: Current daily study streak
+    """
+
+    learner_id: str
+    name: str
+    created_at: datetime
+    total_study_time_minutes: int
+    concepts_mastered: int
+    current_streak_days: int
+
+
+@dataclass
+class DueReviewRow:
+    """A concept due for review, ready for display.
+
+    Attributes:
+        domain_id: The concept's domain
+        concept_id: The concept identifier
+        display_name: Human-readable name derived from the concept ID
+        mastery_pct: Overall mastery (0-100) computed in SQL
+    """
+
+    domain_id: str
+    concept_id: str
+    display_name: str
+    mastery_pct: float
+
+
+@functools.lru_cache(maxsize=4096)
+def _concept_display_name(concept_id: str) -> str:
+    """Derive a display name like "List Comprehension" from a concept ID.
+
+    Cached, since the same due concepts are listed on every review page load.
+    """
+    return concept_id.rsplit(".", 1)[-1].replace("_", " ").title()
+
+
+def _iso(value: datetime | None) -> str | None:
+    """Format an optional datetime for storage."""
+    return value.isoformat() if value else None
+
+
+def _from_iso(value: str | None) -> datetime | None:
+    """Parse an optional stored datetime.
+
+    Takes the column value once, so each sqlite3.Row field (looked up by
+    name) is read a single time.
+    """
+    return datetime.fromisoformat(value) if value else None
+
+
+# Upsert for one concept mastery row, run with executemany by save()
+_MASTERY_UPSERT_SQL = """
+INSERT INTO concept_mastery (
+    learner_id, domain_id, concept_id,
+    recognition_score, comprehension_score, application_score,
+    exposure_count, first_exposure, last_exposure, last_assessment,
+    ease_factor, interval_days, next_review
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(learner_id, domain_id, concept_id) DO UPDATE SET
+    recognition_score = excluded.recognition_score,
+    comprehension_score = excluded.comprehension_score,
+    application_score = excluded.application_score,
+    exposure_count = excluded.exposure_count,
+    first_exposure = excluded.first_exposure,
+    last_exposure = excluded.last_exposure,
+    last_assessment = excluded.last_assessment,
+    ease_factor = excluded.ease_factor,
+    interval_days = excluded.interval_days,
+    next_review = excluded.next_review
+"""
+
+
+# A learner row joined with all of its mastery rows, used by get(). The
+# mastery columns are listed explicitly so none shadow the learner's
+# columns of the same name (such as learner_id) in the returned rows
+_GET_PROFILE_WITH_MASTERY_SQL = """
+SELECT l.*,
+       m.domain_id, m.concept_id,
+       m.recognition_score, m.comprehension_score, m.application_score,
+       m.exposure_count, m.first_exposure, m.last_exposure, m.last_assessment,
+       m.ease_factor, m.interval_days, m.next_review
+FROM learners l
+LEFT JOIN concept_mastery m ON m.learner_id = l.learner_id
+WHERE l.learner_id = ?
+"""
+
+
+# Every dashboard statistic for one learner in a single row. Per-domain
+# aggregates come back as a JSON object of [concept_count, avg_mastery]
+_LEARNER_STATS_SQL = """
+WITH dom AS (
+    SELECT domain_id, COUNT(*) AS concept_count,
+           AVG(recognition_score * 0.2 + comprehension_score * 0.3 + application_score * 0.5) AS avg_mastery
+    FROM concept_mastery
+    WHERE learner_id = ?
+    GROUP BY domain_id
+),
+ass AS (
+    SELECT COUNT(*) AS total, COALESCE(SUM(is_correct), 0) AS correct
+    FROM assessment_results
+    WHERE learner_id = ?
+),
+due AS (
+    SELECT COUNT(*) AS due_count
+    FROM concept_mastery
+    WHERE learner_id = ?
+    AND (next_review IS NULL OR next_review <= ?)
+)
+SELECT l.name, l.total_study_time_minutes, l.concepts_mastered, l.current_streak_days,
+       (SELECT json_group_object(domain_id, json_array(concept_count, avg_mastery)) FROM dom) AS domains,
+       ass.total AS total_assessments, ass.correct AS correct_assessments,
+       due.due_count
+FROM learners l, ass, due
+WHERE l.learner_id = ?
+"""
+
+
 # SQL Schema
 SCHEMA = """
 -- Learner profiles
@@ -44,7 +176,8 @@ CREATE TABLE IF NOT EXISTS learners (
     total_study_time_minutes INTEGER DEFAULT 0,
     concepts_mastered INTEGER DEFAULT 0,
     current_streak_days INTEGER DEFAULT 0,
-    last_study_date TEXT
+    last_study_date TEXT,
+    version INTEGER NOT NULL DEFAULT 0  -- bumped by every save
 );
 
 -- Concept mastery records
@@ -96,15 +229,48 @@ CREATE TABLE IF NOT EXISTS learning_sessions (
     FOREIGN KEY (learner_id) REFERENCES learners(learner_id) ON DELETE CASCADE
 );
 
--- Indexes for common queries
-CREATE INDEX IF NOT EXISTS idx_mastery_learner ON concept_mastery(learner_id);
-CREATE INDEX IF NOT EXISTS idx_mastery_domain ON concept_mastery(learner_id, domain_id);
-CREATE INDEX IF NOT EXISTS idx_mastery_review ON concept_mastery(next_review);
-CREATE INDEX IF NOT EXISTS idx_results_learner ON assessment_results(learner_id);
+-- Indexes for common queries. Every foreign key column leads an index, so
+-- cascading deletes from learners never scan a child table.
+-- concept_mastery's UNIQUE(learner_id, domain_id, concept_id) index
+-- already serves learner and learner+domain lookups.
+CREATE INDEX IF NOT EXISTS idx_mastery_due ON concept_mastery(learner_id, next_review);
+CREATE INDEX IF NOT EXISTS idx_results_concept ON assessment_results(learner_id, concept_id, timestamp DESC);
 CREATE INDEX IF NOT EXISTS idx_sessions_learner ON learning_sessions(learner_id);
+
+-- Superseded by the indexes above
+DROP INDEX IF EXISTS idx_mastery_review;
+DROP INDEX IF EXISTS idx_mastery_learner;
+DROP INDEX IF EXISTS idx_mastery_domain;
+DROP INDEX IF EXISTS idx_results_learner;
 """
 
 
+# Per-connection settings: fewer fsyncs (safe with WAL), in-memory temp
+# tables, a ~20 MB page cache, and enforced foreign keys so deletes cascade
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=134217728",
+    "PRAGMA foreign_keys=ON",
+)
+
+
+# Number of learner profiles a LearnerRepository keeps in memory
+PROFILE_CACHE_SIZE = 32
+
+# Maximum number of SQLite connections kept open by a Database
+DEFAULT_POOL_SIZE = 4
+
+# Rows fetched per trip to aiosqlite's worker thread when iterating a
+# cursor with `async for` (aiosqlite defaults to 64)
+_ITER_CHUNK_SIZE = 512
+
+# Prepared statements cached per connection. Pooled connections live for
+# the whole process, so every query the repository runs stays prepared
+_STATEMENT_CACHE_SIZE = 256
+
+
 class Database:
     """Async SQLite database connection manager.
 
@@ -117,22 +283,44 @@ class Database:
 
         async with db.connection() as conn:
             await conn.execute("SELECT * FROM learners")
+
+        await db.close()
+
+        # Or initialize and close around a block
+        async with Database("holocron.db") as db:
+            ...
         ```
     """
 
-    def __init__(self, db_path: str | Path) -> None:
+    def __init__(self, db_path: str | Path, pool_size: int = DEFAULT_POOL_SIZE) -> None:
         """Initialize database with path.
 
         Args:
             db_path: Path to SQLite database file
+            pool_size: Maximum number of connections kept open
         """
         self.db_path = Path(db_path)
+        self.pool_size = pool_size
         self._initialized = False
+        self._pool: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        # Every connection the pool has opened, idle or checked out
+        self._connections: set[aiosqlite.Connection] = set()
+        self._open_connections = 0
+
+    async def __aenter__(self) -> "Database":
+        """Initialize the database for use in an ``async with`` block."""
+        await self.initialize()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close every pooled connection on leaving the block."""
+        await self.close()
 
     async def initialize(self) -> None:
         """Initialize database schema.
 
-        Creates tables if they don't exist.
+        Creates tables if they don't exist and switches the database to
+        write-ahead logging.
         """
         if self._initialized:
             return
@@ -141,24 +329,102 @@ class Database:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         async with aiosqlite.connect(self.db_path) as db:
+            # WAL lets readers proceed while a save is writing; the mode is
+            # stored in the database file, so setting it once is enough
+            await db.execute("PRAGMA journal_mode=WAL")
             await db.executescript(SCHEMA)
+
+            # Databases created before learners.version existed
+            cursor = await db.execute("PRAGMA table_info(learners)")
+            if "version" not in {row[1] for row in await cursor.fetchall()}:
+                await db.execute(
+                    "ALTER TABLE learners ADD COLUMN version INTEGER NOT NULL DEFAULT 0"
+                )
             await db.commit()
 
         self._initialized = True
 
+    async def _connect(self) -> aiosqlite.Connection:
+        """Open and configure a new pooled connection."""
+        conn = await aiosqlite.connect(
+            self.db_path,
+            iter_chunk_size=_ITER_CHUNK_SIZE,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+        )
+        try:
+            conn.row_factory = aiosqlite.Row
+            for pragma in _CONNECTION_PRAGMAS:
+                await conn.execute(pragma)
+        except BaseException:
+            await conn.close()
+            raise
+        self._connections.add(conn)
+        return conn
+
+    async def _acquire(self) -> aiosqlite.Connection:
+        """Take an idle connection, opening one if the pool isn't full."""
+        try:
+            return self._pool.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+
+        if self._open_connections < self.pool_size:
+            self._open_connections += 1
+            try:
+                return await self._connect()
+            except BaseException:
+                self._open_connections -= 1
+                raise
+
+        return await self._pool.get()
+
     @asynccontextmanager
     async def connection(self) -> AsyncGenerator[aiosqlite.Connection, None]:
         """Get a database connection.
 
+        Connections are kept open and reused, so repository calls don't
+        pay for opening SQLite and re-applying pragmas each time.
+
         Yields:
             Async SQLite connection
         """
         if not self._initialized:
             await self.initialize()
 
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            yield db
+        conn = await self._acquire()
+        try:
+            yield conn
+        finally:
+            # A connection closed by close() while checked out isn't reused
+            if conn in self._connections:
+                # Don't hand the next caller a half-finished transaction
+                if conn.in_transaction:
+                    await conn.rollback()
+                self._pool.put_nowait(conn)
+
+    async def close(self) -> None:
+        """Close every connection the pool has opened.
+
+        Pooled connections each own a worker thread, so a Database that is
+        never closed keeps the process alive at exit. Each connection runs
+        PRAGMA optimize first, so SQLite refreshes planner statistics for
+        the tables it queried, including after bulk saves. Connections
+        still checked out are closed too; their holders can't use them
+        afterwards.
+        """
+        while not self._pool.empty():
+            self._pool.get_nowait()
+        connections, self._connections = self._connections, set()
+        self._open_connections = 0
+
+        for conn in connections:
+            try:
+                await conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                # Statistics are an optimization; still close the connection
+                pass
+            finally:
+                await conn.close()
 
 
 class LearnerRepository:
@@ -182,21 +448,66 @@ class LearnerRepository:
         ```
     """
 
-    def __init__(self, database: Database) -> None:
+    def __init__(self, database: Database, cache_size: int = PROFILE_CACHE_SIZE) -> None:
         """Initialize repository with database.
 
+        Profiles returned by get() and passed to save() are kept in a small
+        LRU cache along with their learners.version. get() only rebuilds a
+        cached profile when that version has moved, so writes from another
+        process or repository are still seen. Cached profiles are shared
+        objects, so changes should go through save().
+
         Args:
             database: Database instance
+            cache_size: Number of profiles to cache (0 disables caching)
         """
         self.db = database
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, tuple[int, LearnerProfile]] = OrderedDict()
+
+    def _cache_put(self, profile: LearnerProfile, version: int) -> None:
+        """Cache a profile at a version, evicting the least recently used if full."""
+        if self.cache_size <= 0:
+            return
+        self._cache[profile.learner_id] = (version, profile)
+        self._cache.move_to_end(profile.learner_id)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
 
     async def save(self, profile: LearnerProfile) -> None:
         """Save or update a learner profile.
 
+        The learner row and all mastery rows are written in one
+        transaction, with the mastery rows sent as a single batch.
+
         Args:
             profile: LearnerProfile to save
         """
+        learner_id = profile.learner_id
+        mastery_rows = [
+            (
+                learner_id,
+                domain_id,
+                mastery.concept_id,
+                mastery.recognition_score,
+                mastery.comprehension_score,
+                mastery.application_score,
+                mastery.exposure_count,
+                _iso(mastery.first_exposure),
+                _iso(mastery.last_exposure),
+                _iso(mastery.last_assessment),
+                mastery.ease_factor,
+                mastery.interval_days,
+                _iso(mastery.next_review),
+            )
+            for domain_id, concepts in profile.domain_mastery.items()
+            for mastery in concepts.values()
+        ]
+
         async with self.db.connection() as conn:
+            # Take the write lock up front rather than upgrading mid-transaction
+            await conn.execute("BEGIN IMMEDIATE")
+
             # Save learner record
             await conn.execute(
                 """
@@ -211,71 +522,33 @@ class LearnerRepository:
                     total_study_time_minutes = excluded.total_study_time_minutes,
                     concepts_mastered = excluded.concepts_mastered,
                     current_streak_days = excluded.current_streak_days,
-                    last_study_date = excluded.last_study_date
+                    last_study_date = excluded.last_study_date,
+                    version = learners.version + 1
                 """,
                 (
-                    profile.learner_id,
+                    learner_id,
                     profile.name,
                     profile.created_at.isoformat(),
                     json.dumps(self._preferences_to_dict(profile.preferences)),
                     profile.total_study_time_minutes,
                     profile.concepts_mastered,
                     profile.current_streak_days,
-                    profile.last_study_date.isoformat() if profile.last_study_date else None,
+                    _iso(profile.last_study_date),
                 ),
             )
+            cursor = await conn.execute(
+                "SELECT version FROM learners WHERE learner_id = ?", (learner_id,)
+            )
+            (version,) = await cursor.fetchone()
 
             # Save mastery records
-            for domain_id, concepts in profile.domain_mastery.items():
-                for concept_id, mastery in concepts.items():
-                    await self._save_mastery(conn, profile.learner_id, domain_id, mastery)
+            if mastery_rows:
+                await conn.executemany(_MASTERY_UPSERT_SQL, mastery_rows)
 
             await conn.commit()
 
-    async def _save_mastery(
-        self,
-        conn: aiosqlite.Connection,
-        learner_id: str,
-        domain_id: str,
-        mastery: ConceptMastery,
-    ) -> None:
-        """Save a concept mastery record."""
-        await conn.execute(
-            """
-            INSERT INTO concept_mastery (
-                learner_id, domain_id, concept_id,
-                recognition_score, comprehension_score, application_score,
-                exposure_count, first_exposure, last_exposure, last_assessment,
-                ease_factor, interval_days, next_review
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(learner_id, domain_id, concept_id) DO UPDATE SET
-                recognition_score = excluded.recognition_score,
-                comprehension_score = excluded.comprehension_score,
-                application_score = excluded.application_score,
-                exposure_count = excluded.exposure_count,
-                first_exposure = excluded.first_exposure,
-                last_exposure = excluded.last_exposure,
-                last_assessment = excluded.last_assessment,
-                ease_factor = excluded.ease_factor,
-                interval_days = excluded.interval_days,
-                next_review = excluded.next_review
-            """,
-            (
-                learner_id,
-                domain_id,
-                mastery.concept_id,
-                mastery.recognition_score,
-                mastery.comprehension_score,
-                mastery.application_score,
-                mastery.exposure_count,
-                mastery.first_exposure.isoformat() if mastery.first_exposure else None,
-                mastery.last_exposure.isoformat() if mastery.last_exposure else None,
-                mastery.last_assessment.isoformat() if mastery.last_assessment else None,
-                mastery.ease_factor,
-                mastery.interval_days,
-                mastery.next_review.isoformat() if mastery.next_review else None,
-            ),
-        )
+        # Write-through: the saved profile is now the freshest copy
+        self._cache_put(profile, version)
 
     async def get(self, learner_id: str) -> LearnerProfile | None:
         """Get a learner profile by ID.
@@ -287,33 +560,38 @@ class LearnerRepository:
             LearnerProfile if found, None otherwise
         """
         async with self.db.connection() as conn:
-            # Get learner record
-            cursor = await conn.execute(
-                "SELECT * FROM learners WHERE learner_id = ?",
-                (learner_id,),
-            )
-            row = await cursor.fetchone()
-
-            if row is None:
-                return None
-
-            # Build profile
-            profile = self._row_to_profile(row)
-
-            # Load mastery records
+            cached = self._cache.get(learner_id)
+            if cached is not None:
+                # One indexed column read tells whether anyone saved since
+                cursor = await conn.execute(
+                    "SELECT version FROM learners WHERE learner_id = ?", (learner_id,)
+                )
+                row = await cursor.fetchone()
+                if row is not None and row[0] == cached[0]:
+                    self._cache.move_to_end(learner_id)
+                    return cached[1]
+                self._cache.pop(learner_id, None)
+
+            # Learner and mastery records in one query; a learner without
+            # mastery records comes back as a single row of NULL mastery columns
             cursor = await conn.execute(
-                "SELECT * FROM concept_mastery WHERE learner_id = ?",
+                _GET_PROFILE_WITH_MASTERY_SQL,
                 (learner_id,),
             )
-            async for mastery_row in cursor:
-                domain_id = mastery_row["domain_id"]
-                if domain_id not in profile.domain_mastery:
-                    profile.domain_mastery[domain_id] = {}
-
-                mastery = self._row_to_mastery(mastery_row)
-                profile.domain_mastery[domain_id][mastery.concept_id] = mastery
 
-            return profile
+            profile = None
+            async for row in cursor:
+                if profile is None:
+                    profile = self._row_to_profile(row)
+                    version = row["version"]
+                if row["concept_id"] is None:
+                    continue
+                mastery = self._row_to_mastery(row)
+                profile.domain_mastery.setdefault(row["domain_id"], {})[mastery.concept_id] = mastery
+
+        if profile is not None:
+            self._cache_put(profile, version)
+        return profile
 
     async def list_all(self) -> list[LearnerProfile]:
         """List all learner profiles.
@@ -328,6 +606,43 @@ class LearnerRepository:
                 profiles.append(self._row_to_profile(row))
         return profiles
 
+    async def list_summaries(self) -> list[LearnerSummary]:
+        """List every learner's listing fields.
+
+        Cheaper than list_all() for listings: only the needed columns are
+        read and preferences aren't decoded.
+
+        Returns:
+            List of LearnerSummary objects ordered by name
+        """
+        async with self.db.connection() as conn:
+            cursor = await conn.execute(
+                """
+                SELECT learner_id, name, created_at, total_study_time_minutes,
+                       concepts_mastered, current_streak_days
+                FROM learners ORDER BY name
+                """
+            )
+            cursor.row_factory = None
+            return [
+                LearnerSummary(
+                    learner_id=learner_id,
+                    name=name,
+                    created_at=datetime.fromisoformat(created_at),
+                    total_study_time_minutes=total_study_time_minutes,
+                    concepts_mastered=concepts_mastered,
+                    current_streak_days=current_streak_days,
+                )
+                for (
+                    learner_id,
+                    name,
+                    created_at,
+                    total_study_time_minutes,
+                    concepts_mastered,
+                    current_streak_days,
+                ) in await cursor.fetchall()
+            ]
+
     async def delete(self, learner_id: str) -> bool:
         """Delete a learner profile.
 
@@ -337,6 +652,7 @@ class LearnerRepository:
         Returns:
             True if deleted, False if not found
         """
+        self._cache.pop(learner_id, None)
         async with self.db.connection() as conn:
             cursor = await conn.execute(
                 "DELETE FROM learners WHERE learner_id = ?",
@@ -362,18 +678,26 @@ class LearnerRepository:
             return await cursor.fetchone() is not None
 
     async def get_concepts_due_for_review(
-        self, learner_id: str, domain_id: str | None = None
+        self,
+        learner_id: str,
+        domain_id: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> list[tuple[str, str]]:
         """Get concepts due for spaced repetition review.
 
         Args:
             learner_id: The learner's ID
             domain_id: Optional domain filter
+            limit: Maximum number of concepts to return (None = all)
+            offset: Number of due concepts to skip, for pagination
 
         Returns:
             List of (domain_id, concept_id) tuples
         """
         now = _utc_now().isoformat()
+        # SQLite treats a negative LIMIT as "no limit"
+        page = (-1 if limit is None else limit, offset)
         async with self.db.connection() as conn:
             if domain_id:
                 cursor = await conn.execute(
@@ -382,8 +706,9 @@ class LearnerRepository:
                     WHERE learner_id = ? AND domain_id = ?
                     AND (next_review IS NULL OR next_review <= ?)
                     ORDER BY next_review
+                    LIMIT ? OFFSET ?
                     """,
-                    (learner_id, domain_id, now),
+                    (learner_id, domain_id, now, *page),
                 )
             else:
                 cursor = await conn.execute(
@@ -392,17 +717,59 @@ class LearnerRepository:
                     WHERE learner_id = ?
                     AND (next_review IS NULL OR next_review <= ?)
                     ORDER BY next_review
+                    LIMIT ? OFFSET ?
                     """,
-                    (learner_id, now),
+                    (learner_id, now, *page),
                 )
 
-            return [(row["domain_id"], row["concept_id"]) async for row in cursor]
+            # Plain tuples already have the (domain_id, concept_id) shape
+            # callers want, so skip building a Row for each result
+            cursor.row_factory = None
+            return await cursor.fetchall()
+
+    async def get_due_review_rows(self, learner_id: str) -> list[DueReviewRow]:
+        """Get concepts due for review along with their display data.
+
+        Mastery percentages are computed in the same query, so callers
+        don't need to look up each concept's mastery separately.
+
+        Args:
+            learner_id: The learner's ID
+
+        Returns:
+            List of DueReviewRow objects, earliest review first
+        """
+        now = _utc_now().isoformat()
+        async with self.db.connection() as conn:
+            cursor = await conn.execute(
+                """
+                SELECT domain_id, concept_id,
+                       recognition_score * 0.2 + comprehension_score * 0.3
+                           + application_score * 0.5 AS mastery_pct
+                FROM concept_mastery
+                WHERE learner_id = ?
+                AND (next_review IS NULL OR next_review <= ?)
+                ORDER BY next_review
+                """,
+                (learner_id, now),
+            )
+
+            return [
+                DueReviewRow(
+                    domain_id=row["domain_id"],
+                    concept_id=row["concept_id"],
+                    display_name=_concept_display_name(row["concept_id"]),
+                    mastery_pct=row["mastery_pct"],
+                )
+                async for row in cursor
+            ]
 
     async def save_assessment_result(
         self,
         learner_id: str,
         domain_id: str,
         result: AssessmentResult,
+        concept_id: str = "",
     ) -> None:
         """Save an assessment result.
 
@@ -410,9 +777,43 @@ class LearnerRepository:
             learner_id: The learner's ID
             domain_id: The domain of the assessment
             result: The assessment result to save
+            concept_id: The concept the assessment tested
+        """
+        await self.save_assessment_results(learner_id, domain_id, [(concept_id, result)])
+
+    async def save_assessment_results(
+        self,
+        learner_id: str,
+        domain_id: str,
+        results: Iterable[tuple[str, AssessmentResult]],
+    ) -> None:
+        """Save several assessment results in one transaction.
+
+        Args:
+            learner_id: The learner's ID
+            domain_id: The domain of the assessments
+            results: (concept_id, result) pairs to save
         """
+        rows = [
+            (
+                result.assessment_id,
+                learner_id,
+                concept_id,
+                domain_id,
+                result.timestamp.isoformat(),
+                result.response,
+                1 if result.is_correct else 0,
+                result.score,
+                result.feedback,
+                result.grading_rationale,
+            )
+            for concept_id, result in results
+        ]
+        if not rows:
+            return
+
         async with self.db.connection() as conn:
-            await conn.execute(
+            await conn.executemany(
                 """
                 INSERT INTO assessment_results (
                     assessment_id, learner_id, concept_id, domain_id,
@@ -420,18 +821,7 @@ class LearnerRepository:
                     feedback, grading_rationale
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                (
-                    result.assessment_id,
-                    learner_id,
-                    result.assessment_id.split("-")[0] if "-" in result.assessment_id else "",
-                    domain_id,
-                    result.timestamp.isoformat(),
-                    result.response,
-                    1 if result.is_correct else 0,
-                    result.score,
-                    result.feedback,
-                    result.grading_rationale,
-                ),
+                rows,
             )
             await conn.commit()
 
@@ -444,63 +834,37 @@ class LearnerRepository:
         Returns:
             Dictionary with learner statistics
         """
+        now = _utc_now().isoformat()
         async with self.db.connection() as conn:
-            # Basic stats
             cursor = await conn.execute(
-                "SELECT * FROM learners WHERE learner_id = ?",
-                (learner_id,),
+                _LEARNER_STATS_SQL,
+                (learner_id, learner_id, learner_id, now, learner_id),
             )
-            learner = await cursor.fetchone()
-            if not learner:
+            row = await cursor.fetchone()
+            if not row:
                 return {}
 
-            # Mastery counts by domain
-            cursor = await conn.execute(
-                """
-                SELECT domain_id, COUNT(*) as concept_count,
-                       AVG(recognition_score * 0.2 + comprehension_score * 0.3 + application_score * 0.5) as avg_mastery
-                FROM concept_mastery
-                WHERE learner_id = ?
-                GROUP BY domain_id
-                """,
-                (learner_id,),
-            )
-            domains = {}
-            async for row in cursor:
-                domains[row["domain_id"]] = {
-                    "concept_count": row["concept_count"],
-                    "avg_mastery": round(row["avg_mastery"] or 0, 1),
+            domains = {
+                domain_id: {
+                    "concept_count": concept_count,
+                    "avg_mastery": round(avg_mastery or 0, 1),
                 }
-
-            # Assessment stats
-            cursor = await conn.execute(
-                """
-                SELECT COUNT(*) as total, SUM(is_correct) as correct
-                FROM assessment_results
-                WHERE learner_id = ?
-                """,
-                (learner_id,),
-            )
-            assessment_row = await cursor.fetchone()
-
-            # Due for review
-            due_count = len(await self.get_concepts_due_for_review(learner_id))
+                for domain_id, (concept_count, avg_mastery) in json.loads(row["domains"]).items()
+            }
+            total = row["total_assessments"]
+            correct = row["correct_assessments"]
 
             return {
                 "learner_id": learner_id,
-                "name": learner["name"],
-                "total_study_time_minutes": learner["total_study_time_minutes"],
-                "concepts_mastered": learner["concepts_mastered"],
-                "current_streak_days": learner["current_streak_days"],
+                "name": row["name"],
+                "total_study_time_minutes": row["total_study_time_minutes"],
+                "concepts_mastered": row["concepts_mastered"],
+                "current_streak_days": row["current_streak_days"],
                 "domains": domains,
-                "total_assessments": assessment_row["total"] or 0,
-                "correct_assessments": assessment_row["correct"] or 0,
-                "accuracy": (
-                    round((assessment_row["correct"] or 0) / assessment_row["total"] * 100, 1)
-                    if assessment_row["total"]
-                    else 0
-                ),
-                "concepts_due_for_review": due_count,
+                "total_assessments": total,
+                "correct_assessments": correct,
+                "accuracy": round(correct / total * 100, 1) if total else 0,
+                "concepts_due_for_review": row["due_count"],
             }
 
     def _row_to_profile(self, row: aiosqlite.Row) -> LearnerProfile:
@@ -521,11 +885,7 @@ class LearnerRepository:
             total_study_time_minutes=row["total_study_time_minutes"],
             concepts_mastered=row["concepts_mastered"],
             current_streak_days=row["current_streak_days"],
-            last_study_date=(
-                datetime.fromisoformat(row["last_study_date"])
-                if row["last_study_date"]
-                else None
-            ),
+            last_study_date=_from_iso(row["last_study_date"]),
         )
 
     def _row_to_mastery(self, row: aiosqlite.Row) -> ConceptMastery:
@@ -537,28 +897,12 @@ class LearnerRepository:
             comprehension_score=row["comprehension_score"],
             application_score=row["application_score"],
             exposure_count=row["exposure_count"],
-            first_exposure=(
-                datetime.fromisoformat(row["first_exposure"])
-                if row["first_exposure"]
-                else None
-            ),
-            last_exposure=(
-                datetime.fromisoformat(row["last_exposure"])
-                if row["last_exposure"]
-                else None
-            ),
-            last_assessment=(
-                datetime.fromisoformat(row["last_assessment"])
-                if row["last_assessment"]
-                else None
-            ),
+            first_exposure=_from_iso(row["first_exposure"]),
+            last_exposure=_from_iso(row["last_exposure"]),
+            last_assessment=_from_iso(row["last_assessment"]),
             ease_factor=row["ease_factor"],
             interval_days=row["interval_days"],
-            next_review=(
-                datetime.fromisoformat(row["next_review"])
-                if row["next_review"]
-                else None
-            ),
+            next_review=_from_iso(row["next_review"]),
         )
 
     def _preferences_to_dict(self, prefs: LearnerPreferences) -> dict[str, Any]:
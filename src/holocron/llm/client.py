@@ -9,10 +9,15 @@ Supported providers:
 - Google (Gemini)
 """
 
+import functools
+import os
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Callable
 
 import litellm
+import tiktoken
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -23,6 +28,88 @@ from tenacity import (
 from holocron.config import get_settings
 
 
+@functools.lru_cache(maxsize=1)
+def _configure_api_keys() -> None:
+    """Export configured API keys for LiteLLM.
+
+    Settings are fixed for the life of the process, so this only needs to
+    run once rather than on every client construction.
+    """
+    settings = get_settings()
+    for env_var, key in (
+        ("ANTHROPIC_API_KEY", settings.anthropic_api_key),
+        ("OPENAI_API_KEY", settings.openai_api_key),
+        ("GEMINI_API_KEY", settings.gemini_api_key),
+    ):
+        if key:
+            os.environ[env_var] = key
+
+
+# Approximate (input, output) costs in USD per 1K tokens, keyed by model
+# name fragment. More specific fragments come first so "gpt-4-turbo"
+# isn't priced as "gpt-4"
+_MODEL_COSTS = (
+    ("gpt-4-turbo", (0.01, 0.03)),
+    ("gpt-4", (0.03, 0.06)),
+    ("gpt-3.5-turbo", (0.0005, 0.0015)),
+    ("claude-3-opus", (0.015, 0.075)),
+    ("claude-3-sonnet", (0.003, 0.015)),
+    ("claude-3-haiku", (0.00025, 0.00125)),
+    ("gemini-pro", (0.00025, 0.0005)),
+)
+
+# Cost per 1K tokens, input and output alike, for unrecognized models
+_DEFAULT_COST = (0.01, 0.01)
+
+# Minimum characters passed to a streaming callback at once
+_STREAM_FLUSH_CHARS = 32
+
+
+@functools.lru_cache(maxsize=64)
+def _model_costs(model: str) -> tuple[float, float]:
+    """Look up the (input, output) cost per 1K tokens for a model."""
+    model = model.lower()
+    for fragment, costs in _MODEL_COSTS:
+        if fragment in model:
+            return costs
+    return _DEFAULT_COST
+
+
+class _StreamCollector:
+    """Collect streamed content and pass it to a callback in batches.
+
+    Parts are kept in lists rather than growing a string, and the callback
+    receives batches of at least _STREAM_FLUSH_CHARS characters.
+    """
+
+    def __init__(self, callback: Callable[[str], None]) -> None:
+        self.callback = callback
+        self.parts: list[str] = []
+        self.pending: list[str] = []
+        self.pending_len = 0
+
+    def add(self, chunk) -> None:
+        """Record one streamed chunk, flushing the batch once it is large enough."""
+        content = chunk.choices[0].delta.content
+        if not content:
+            return
+        self.parts.append(content)
+        self.pending.append(content)
+        self.pending_len += len(content)
+        if self.pending_len >= _STREAM_FLUSH_CHARS:
+            self.callback("".join(self.pending))
+            self.pending.clear()
+            self.pending_len = 0
+
+    def finish(self) -> str:
+        """Flush any remaining batch and return the full content."""
+        if self.pending:
+            self.callback("".join(self.pending))
+            self.pending.clear()
+            self.pending_len = 0
+        return "".join(self.parts)
+
+
 @dataclass
 class LLMResponse:
     """Response from an LLM call.
@@ -31,13 +118,17 @@ class LLMResponse:
         content: The response text
         model: The model that generated the response
         usage: Token usage information
-        raw_response: The full response object
+        raw_response: The full response object, if the client keeps it
+        finish_reason: Why generation stopped (e.g. "stop", "length")
+        response_id: Provider-assigned response identifier
     """
 
     content: str
     model: str
     usage: dict[str, int]
     raw_response: Any = None
+    finish_reason: str | None = None
+    response_id: str | None = None
 
 
 class LLMClient:
@@ -64,6 +155,8 @@ class LLMClient:
         model: str | None = None,
         temperature: float | None = None,
         max_retries: int = 3,
+        cache_size: int = 0,
+        keep_raw: bool = False,
     ) -> None:
         """Initialize the LLM client.
 
@@ -71,26 +164,23 @@ class LLMClient:
             model: Model identifier (e.g., "gpt-4", "claude-3-sonnet")
             temperature: Sampling temperature (0-1)
             max_retries: Maximum retry attempts for failed requests
+            cache_size: Number of completions to remember (0 disables
+                caching). Identical requests are then answered from memory.
+            keep_raw: Keep the full provider response on each LLMResponse.
+                Off by default, since those objects are large and long
+                sessions would otherwise hold on to every one of them.
         """
         settings = get_settings()
 
         self.model = model or settings.default_model
         self.temperature = temperature if temperature is not None else settings.temperature
         self.max_retries = max_retries
+        self.cache_size = cache_size
+        self.keep_raw = keep_raw
+        self._cache: OrderedDict[tuple, LLMResponse] = OrderedDict()
 
         # Configure API keys from settings
-        self._configure_api_keys(settings)
-
-    def _configure_api_keys(self, settings) -> None:
-        """Configure API keys for LiteLLM."""
-        import os
-
-        if settings.anthropic_api_key:
-            os.environ["ANTHROPIC_API_KEY"] = settings.anthropic_api_key
-        if settings.openai_api_key:
-            os.environ["OPENAI_API_KEY"] = settings.openai_api_key
-        if settings.gemini_api_key:
-            os.environ["GEMINI_API_KEY"] = settings.gemini_api_key
+        _configure_api_keys()
 
     @retry(
         retry=retry_if_exception_type((litellm.RateLimitError, litellm.APIConnectionError)),
@@ -117,31 +207,121 @@ class LLMClient:
         Returns:
             LLMResponse with the generated content
         """
+        model = model or self.model
+        temperature = temperature if temperature is not None else self.temperature
+
+        cache_key = (model, system_prompt, user_message, temperature, max_tokens)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        response = litellm.completion(
+            model=model,
+            messages=self._build_messages(user_message, system_prompt),
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+
+        result = self._to_response(response)
+        self._cache_put(cache_key, result)
+        return result
+
+    @retry(
+        retry=retry_if_exception_type((litellm.RateLimitError, litellm.APIConnectionError)),
+        wait=wait_exponential(multiplier=1, min=2, max=60),
+        stop=stop_after_attempt(3),
+    )
+    async def acomplete(
+        self,
+        user_message: str,
+        system_prompt: str | None = None,
+        model: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> LLMResponse:
+        """Generate a completion without blocking the event loop.
+
+        Async counterpart of complete(), for use from async code such as
+        the REPL and GUI, so database work and input handling continue
+        while the provider responds.
+
+        Args:
+            user_message: The user's input message
+            system_prompt: Optional system prompt
+            model: Override the default model
+            temperature: Override the default temperature
+            max_tokens: Maximum tokens in response
+
+        Returns:
+            LLMResponse with the generated content
+        """
+        model = model or self.model
+        temperature = temperature if temperature is not None else self.temperature
+
+        cache_key = (model, system_prompt, user_message, temperature, max_tokens)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        response = await litellm.acompletion(
+            model=model,
+            messages=self._build_messages(user_message, system_prompt),
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+
+        result = self._to_response(response)
+        self._cache_put(cache_key, result)
+        return result
+
+    @staticmethod
+    def _build_messages(user_message: str, system_prompt: str | None) -> list[dict[str, str]]:
+        """Build the chat messages for a request."""
         messages = []
 
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
 
         messages.append({"role": "user", "content": user_message})
+        return messages
 
-        response = litellm.completion(
-            model=model or self.model,
-            messages=messages,
-            temperature=temperature if temperature is not None else self.temperature,
-            max_tokens=max_tokens,
-        )
+    def _to_response(self, response) -> LLMResponse:
+        """Convert a LiteLLM completion response to an LLMResponse.
 
+        Only the fields callers use are copied out, so the provider
+        response can be freed unless keep_raw is set.
+        """
+        choice = response.choices[0]
         return LLMResponse(
-            content=response.choices[0].message.content,
+            content=choice.message.content,
             model=response.model,
             usage={
                 "prompt_tokens": response.usage.prompt_tokens,
                 "completion_tokens": response.usage.completion_tokens,
                 "total_tokens": response.usage.total_tokens,
             },
-            raw_response=response,
+            raw_response=response if self.keep_raw else None,
+            finish_reason=getattr(choice, "finish_reason", None),
+            response_id=getattr(response, "id", None),
         )
 
+    def _cache_get(self, key: tuple) -> LLMResponse | None:
+        """Return a cached completion, if caching is enabled and it's present."""
+        if self.cache_size <= 0:
+            return None
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+        return cached
+
+    def _cache_put(self, key: tuple, result: LLMResponse) -> None:
+        """Cache a completion, evicting the least recently used if full."""
+        if self.cache_size <= 0:
+            return
+        self._cache[key] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
     def complete_with_callback(
         self,
         user_message: str,
@@ -153,7 +333,9 @@ class LLMClient:
         Args:
             user_message: The user's input message
             system_prompt: Optional system prompt
-            callback: Optional callback for streaming chunks
+            callback: Optional callback for streaming chunks. Small chunks
+                are combined, so each call receives at least
+                _STREAM_FLUSH_CHARS characters except possibly the last.
 
         Returns:
             LLMResponse with the generated content
@@ -161,27 +343,59 @@ class LLMClient:
         if callback is None:
             return self.complete(user_message, system_prompt)
 
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": user_message})
-
         response = litellm.completion(
             model=self.model,
-            messages=messages,
+            messages=self._build_messages(user_message, system_prompt),
             temperature=self.temperature,
             stream=True,
         )
 
-        full_content = ""
+        collector = _StreamCollector(callback)
         for chunk in response:
-            if chunk.choices[0].delta.content:
-                content = chunk.choices[0].delta.content
-                full_content += content
-                callback(content)
+            collector.add(chunk)
+
+        return LLMResponse(
+            content=collector.finish(),
+            model=self.model,
+            usage={"total_tokens": 0},  # Streaming doesn't return usage
+        )
+
+    async def acomplete_with_callback(
+        self,
+        user_message: str,
+        system_prompt: str | None = None,
+        callback: Callable[[str], None] | None = None,
+    ) -> LLMResponse:
+        """Generate a completion with optional streaming callback, asynchronously.
+
+        Async counterpart of complete_with_callback(). Chunks are awaited
+        from the provider, so the event loop keeps running between them.
+
+        Args:
+            user_message: The user's input message
+            system_prompt: Optional system prompt
+            callback: Optional callback for streaming chunks, batched as in
+                complete_with_callback()
+
+        Returns:
+            LLMResponse with the generated content
+        """
+        if callback is None:
+            return await self.acomplete(user_message, system_prompt)
+
+        response = await litellm.acompletion(
+            model=self.model,
+            messages=self._build_messages(user_message, system_prompt),
+            temperature=self.temperature,
+            stream=True,
+        )
+
+        collector = _StreamCollector(callback)
+        async for chunk in response:
+            collector.add(chunk)
 
         return LLMResponse(
-            content=full_content,
+            content=collector.finish(),
             model=self.model,
             usage={"total_tokens": 0},  # Streaming doesn't return usage
         )
@@ -196,9 +410,8 @@ class LLMClient:
             Approximate token count
         """
         try:
-            import tiktoken
-
-            # Use cl100k_base encoding (used by GPT-4, Claude)
+            # Use cl100k_base encoding (used by GPT-4, Claude). tiktoken
+            # caches loaded encodings, so only the first call pays to load it
             encoding = tiktoken.get_encoding("cl100k_base")
             return len(encoding.encode(text))
         except Exception:
@@ -215,27 +428,23 @@ class LLMClient:
         Returns:
             Estimated cost in USD
         """
-        # Approximate costs per 1K tokens (varies by model)
-        costs = {
-            "gpt-4": (0.03, 0.06),
-            "gpt-4-turbo": (0.01, 0.03),
-            "gpt-3.5-turbo": (0.0005, 0.0015),
-            "claude-3-opus": (0.015, 0.075),
-            "claude-3-sonnet": (0.003, 0.015),
-            "claude-3-haiku": (0.00025, 0.00125),
-            "gemini-pro": (0.00025, 0.0005),
-        }
-
-        # Find matching cost tier
-        for model_prefix, (input_cost, output_cost) in costs.items():
-            if model_prefix in self.model.lower():
-                return (
-                    prompt_tokens / 1000 * input_cost
-                    + completion_tokens / 1000 * output_cost
-                )
-
-        # Default estimate
-        return (prompt_tokens + completion_tokens) / 1000 * 0.01
+        input_cost, output_cost = _model_costs(self.model)
+        return prompt_tokens / 1000 * input_cost + completion_tokens / 1000 * output_cost
+
+
+# Client shared by quick_complete() calls, created on first use
+_default_client: LLMClient | None = None
+_default_client_lock = threading.Lock()
+
+
+def _get_default_client() -> LLMClient:
+    """Return the shared default client, creating it if needed."""
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = LLMClient()
+    return _default_client
 
 
 # Convenience function for quick completions
@@ -244,7 +453,7 @@ def quick_complete(
     system_prompt: str | None = None,
     model: str | None = None,
 ) -> str:
-    """Quick completion without creating a client instance.
+    """Quick completion using a shared default client.
 
     Args:
         user_message: The user's input
@@ -254,6 +463,5 @@ def quick_complete(
     Returns:
         The response content string
     """
-    client = LLMClient(model=model)
-    response = client.complete(user_message, system_prompt)
+    response = _get_default_client().complete(user_message, system_prompt, model=model)
     return response.content
@@ -5,20 +5,22 @@ learning sessions with real-time feedback and progress tracking.
 """
 
 import asyncio
+import itertools
+import logging
+import os
+import signal
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable
-from uuid import uuid4
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 
 from rich.console import Console
-from rich.markdown import Markdown
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.prompt import Confirm, Prompt
 from rich.table import Table
-from rich.text import Text
 
 from holocron.core.grader import AssessmentGrader, GradingResult
 from holocron.core.mastery import MasteryEngine
@@ -35,6 +37,23 @@ from holocron.core.transformer import ContentTransformer, TransformConfig
 from holocron.domains.registry import DomainRegistry
 from holocron.learner import Database, LearnerRepository
 
+logger = logging.getLogger(__name__)
+
+# "A. ", "B. ", ... prefixes for multiple choice options
+OPTION_PREFIXES = tuple(f"{chr(65 + i)}. " for i in range(26))
+
+# Process-local sequence for controller session ids
+_SESSION_COUNTER = itertools.count(1)
+
+# "#####-----" style bars indexed by concept difficulty (0-10)
+_DIFFICULTY_BARS = tuple("#" * i + "-" * (10 - i) for i in range(11))
+
+# Seconds a /progress stats snapshot is reused before re-querying the database
+STATS_CACHE_TTL = 30.0
+
+# Seconds to wait after a mastery change so a burst of answers is saved once
+SAVE_DEBOUNCE_SECONDS = 2.0
+
 
 class SessionState(str, Enum):
     """States for the REPL session."""
@@ -46,6 +65,16 @@ class SessionState(str, Enum):
     PAUSED = "paused"
 
 
+# REPL prompt markup for each session state
+_STATE_PROMPTS: dict[SessionState, str] = {
+    SessionState.IDLE: "[cyan]holocron[/cyan]",
+    SessionState.STUDYING: "[green]studying[/green]",
+    SessionState.ASSESSMENT: "[yellow]answer[/yellow]",
+    SessionState.REVIEW: "[magenta]review[/magenta]",
+    SessionState.PAUSED: "[dim]paused[/dim]",
+}
+
+
 @dataclass
 class REPLCommand:
     """A REPL command definition."""
@@ -56,7 +85,7 @@ class REPLCommand:
     handler: Callable[["SessionController", list[str]], None]
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionStats:
     """Statistics for the current session."""
 
@@ -112,7 +141,8 @@ class SessionController:
         self.console = console or Console()
         self.grader = grader or AssessmentGrader()
 
-        # Database and repository
+        # Database and repository; a database opened here is closed by run()
+        self._owns_db = db is None
         if db is None:
             from holocron.learner import get_default_db_path
             db = Database(get_default_db_path())
@@ -123,7 +153,7 @@ class SessionController:
         self.state = SessionState.IDLE
         self.running = False
         self.stats = SessionStats()
-        self.session_id = str(uuid4())[:8]
+        self.session_id = f"{os.getpid():x}-{next(_SESSION_COUNTER):x}"
 
         # Current learning context
         self.learner: LearnerProfile | None = None
@@ -136,28 +166,17 @@ class SessionController:
         self.current_assessments: list[Assessment] = []
         self.current_assessment_index: int = 0
 
-        # Register commands
-        self._commands: dict[str, REPLCommand] = {}
-        self._register_commands()
-
-    def _register_commands(self) -> None:
-        """Register available REPL commands."""
-        commands = [
-            REPLCommand("help", ["h", "?"], "Show available commands", self._cmd_help),
-            REPLCommand("stats", ["s"], "Show session statistics", self._cmd_stats),
-            REPLCommand("progress", ["p"], "Show learning progress", self._cmd_progress),
-            REPLCommand("review", ["r"], "Start spaced repetition review", self._cmd_review),
-            REPLCommand("load", ["l"], "Load content from a file", self._cmd_load),
-            REPLCommand("concept", ["c"], "Show current concept details", self._cmd_concept),
-            REPLCommand("skip", [], "Skip current assessment", self._cmd_skip),
-            REPLCommand("hint", [], "Get a hint for current assessment", self._cmd_hint),
-            REPLCommand("quit", ["q", "exit"], "End the session", self._cmd_quit),
-        ]
+        # (learner_id, domain_id) -> (fetched_at, stats) for /progress
+        self._stats_cache: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
+
+        # Debounced background persistence of learner changes. The lock is
+        # held while a worker thread uses the learner and while it is saved
+        self._dirty = asyncio.Event()
+        self._persist_task: asyncio.Task | None = None
+        self._learner_lock = asyncio.Lock()
 
-        for cmd in commands:
-            self._commands[cmd.name] = cmd
-            for alias in cmd.aliases:
-                self._commands[alias] = cmd
+        # Shared command table, built once at import
+        self._commands = _COMMAND_MAP
 
     async def initialize(self) -> bool:
         """Initialize the session and load learner profile.
@@ -191,20 +210,47 @@ class SessionController:
         """Run the interactive REPL session."""
         self.running = True
 
-        # Initialize
-        if not await self.initialize():
-            self.console.print("[red]Failed to initialize session.[/red]")
-            return
+        try:
+            # Initialize
+            if not await self.initialize():
+                self.console.print("[red]Failed to initialize session.[/red]")
+                return
+
+            # Welcome message
+            self._show_welcome()
 
-        # Welcome message
-        self._show_welcome()
+            # Input is read in a worker thread so the event loop (and the
+            # background writer) keeps running while we wait; Ctrl+C is then
+            # handled on the loop instead of raising KeyboardInterrupt
+            loop = asyncio.get_running_loop()
+            try:
+                loop.add_signal_handler(signal.SIGINT, self._on_interrupt)
+                handles_sigint = True
+            except (NotImplementedError, RuntimeError, ValueError):
+                # No loop signal handlers on Windows or off the main thread
+                handles_sigint = False
+
+            try:
+                self._persist_task = asyncio.create_task(self._persist_loop())
+                await self._repl_loop()
+            finally:
+                if handles_sigint:
+                    loop.remove_signal_handler(signal.SIGINT)
+                # Save session
+                await self._stop_persist_loop()
+                await self._end_session()
+        finally:
+            # Close a database opened here even if initializing or saving failed
+            if self._owns_db:
+                await self.db.close()
 
-        # Main REPL loop
+    async def _repl_loop(self) -> None:
+        """Read and dispatch input until the session stops running."""
         while self.running:
             try:
                 # Get user input
                 prompt = self._get_prompt()
-                user_input = Prompt.ask(prompt).strip()
+                user_input = (await asyncio.to_thread(Prompt.ask, prompt)).strip()
 
                 if not user_input:
                     continue
@@ -220,13 +266,13 @@ class SessionController:
                     await self._handle_free_input(user_input)
 
             except KeyboardInterrupt:
-                self.console.print("\n[dim]Use /quit to exit[/dim]")
+                self._on_interrupt()
             except EOFError:
-                await self._end_session()
                 break
 
-        # Save session
-        await self._end_session()
+    def _on_interrupt(self) -> None:
+        """Remind the user how to leave when Ctrl+C is pressed."""
+        self.console.print("\n[dim]Use /quit to exit[/dim]")
 
     def _show_welcome(self) -> None:
         """Display welcome message."""
@@ -244,14 +290,7 @@ class SessionController:
 
     def _get_prompt(self) -> str:
         """Get the current prompt based on state."""
-        state_prompts = {
-            SessionState.IDLE: "[cyan]holocron[/cyan]",
-            SessionState.STUDYING: "[green]studying[/green]",
-            SessionState.ASSESSMENT: "[yellow]answer[/yellow]",
-            SessionState.REVIEW: "[magenta]review[/magenta]",
-            SessionState.PAUSED: "[dim]paused[/dim]",
-        }
-        return state_prompts.get(self.state, "")
+        return _STATE_PROMPTS.get(self.state, "")
 
     async def _handle_command(self, cmd_input: str) -> None:
         """Handle a command input."""
@@ -281,7 +320,8 @@ class SessionController:
 
         # Grade the response
         with self.console.status("[bold green]Evaluating..."):
-            result = self.grader.grade(assessment, response, self.learner_id)
+            async with self._learner_lock:
+                result = await self.grader.agrade(assessment, response, self.learner_id)
 
         self.stats.assessments_attempted += 1
         if result.is_correct:
@@ -306,6 +346,8 @@ class SessionController:
                 result=assessment_result,
                 bloom_level=assessment.bloom_level,
             )
+            self._stats_cache.clear()
+            self._dirty.set()
 
         # Move to next assessment or finish
         self.current_assessment_index += 1
@@ -357,7 +399,7 @@ class SessionController:
         path = Path(content)
         if path.exists() and path.is_file():
             try:
-                content = path.read_text(encoding="utf-8")
+                content = await asyncio.to_thread(path.read_text, encoding="utf-8")
                 self.console.print(f"[dim]Loaded content from: {path}[/dim]")
             except Exception as e:
                 self.console.print(f"[red]Error reading file: {e}[/red]")
@@ -376,7 +418,8 @@ class SessionController:
                 num_assessments=1,
                 assessment_bloom_levels=[BloomLevel.KNOWLEDGE, BloomLevel.COMPREHENSION],
             )
-            result = self.transformer.transform(content, config)
+            async with self._learner_lock:
+                result = await asyncio.to_thread(self.transformer.transform, content, config)
 
         if not result.concepts_found:
             self.console.print("[yellow]No concepts found in this content.[/yellow]")
@@ -388,6 +431,10 @@ class SessionController:
         self.current_assessment_index = 0
         self.stats.concepts_studied += len(result.concepts_found)
 
+        # The transform recorded exposures for the concepts it found
+        self._stats_cache.clear()
+        self._dirty.set()
+
         # Show extracted concepts
         self.console.print()
         self.console.print(f"[green]Found {len(result.concepts_found)} concepts[/green]")
@@ -397,10 +444,14 @@ class SessionController:
         table.add_column("Difficulty", justify="center")
         table.add_column("Your Mastery", justify="center")
 
-        for concept in result.concepts_found[:10]:
-            mastery = self.learner.get_mastery(self.domain_id, concept.concept_id)
+        shown = result.concepts_found[:10]
+        masteries = self.learner.get_masteries(
+            [(self.domain_id, concept.concept_id) for concept in shown]
+        )
+        for concept in shown:
+            mastery = masteries[(self.domain_id, concept.concept_id)]
             mastery_pct = f"{int(mastery.overall_mastery)}%"
-            diff_bar = "#" * concept.difficulty_score + "-" * (10 - concept.difficulty_score)
+            diff_bar = _DIFFICULTY_BARS[min(max(concept.difficulty_score, 0), 10)]
             table.add_row(concept.name, diff_bar, mastery_pct)
 
         if len(result.concepts_found) > 10:
@@ -411,7 +462,9 @@ class SessionController:
         # Start assessments if available
         if self.current_assessments:
             self.console.print()
-            if Confirm.ask(f"Ready to test your understanding? ({len(self.current_assessments)} questions)"):
+            if await asyncio.to_thread(
+                Confirm.ask, f"Ready to test your understanding? ({len(self.current_assessments)} questions)"
+            ):
                 self.state = SessionState.ASSESSMENT
                 self._show_current_assessment()
             else:
@@ -441,8 +494,7 @@ class SessionController:
         if assessment.options:
             self.console.print()
             for i, option in enumerate(assessment.options):
-                letter = chr(65 + i)  # A, B, C, D
-                self.console.print(f"  {letter}. {option.text}")
+                self.console.print("  " + OPTION_PREFIXES[i] + option.text)
             self.console.print()
             self.console.print("[dim]Enter your answer (A, B, C, D) or type your response[/dim]")
         else:
@@ -476,11 +528,7 @@ class SessionController:
         table.add_column("Aliases", style="dim")
         table.add_column("Description")
 
-        seen = set()
-        for cmd in self._commands.values():
-            if cmd.name in seen:
-                continue
-            seen.add(cmd.name)
+        for cmd in _COMMANDS:
             aliases = ", ".join(cmd.aliases) if cmd.aliases else "-"
             table.add_row(f"/{cmd.name}", aliases, cmd.description)
 
@@ -497,9 +545,7 @@ class SessionController:
         if not self.learner:
             return
 
-        # Reload learner data
-        self.learner = await self.repo.get(self.learner_id)
-        stats = await self.repo.get_learner_stats(self.learner_id)
+        stats = await self._get_progress_stats()
 
         self.console.print()
         self.console.print(
@@ -529,6 +575,29 @@ class SessionController:
                 )
             self.console.print(table)
 
+    async def _get_progress_stats(self) -> dict[str, Any]:
+        """Get learner stats, reusing a recent snapshot when mastery is unchanged."""
+        key = (self.learner_id, self.domain_id)
+        now = time.monotonic()
+        cached = self._stats_cache.get(key)
+        if cached is not None and now - cached[0] < STATS_CACHE_TTL:
+            return cached[1]
+
+        if self._dirty.is_set():
+            # Write pending changes first so the stats include them
+            self._dirty.clear()
+            try:
+                await self._save_learner()
+            except BaseException:
+                self._dirty.set()
+                raise
+
+        # Reload learner data
+        self.learner = await self.repo.get(self.learner_id)
+        stats = await self.repo.get_learner_stats(self.learner_id)
+        self._stats_cache[key] = (now, stats)
+        return stats
+
     async def _cmd_review(self, args: list[str]) -> None:
         """Start spaced repetition review."""
         due_concepts = await self.repo.get_concepts_due_for_review(self.learner_id, self.domain_id)
@@ -544,21 +613,25 @@ class SessionController:
         self.current_assessments = []
         self.current_assessment_index = 0
 
-        for domain_id, concept_id in due_concepts[:5]:  # Limit to 5 per session
-            try:
-                concept = Concept(
-                    concept_id=concept_id,
-                    domain_id=domain_id,
-                    name=concept_id.split(".")[-1].replace("_", " ").title(),
-                    description="Review concept",
-                )
-                assessment = self.adapter.generate_assessment(
-                    concept=concept,
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    self.adapter.generate_assessment,
+                    concept=Concept(
+                        concept_id=concept_id,
+                        domain_id=domain_id,
+                        name=concept_id.split(".")[-1].replace("_", " ").title(),
+                        description="Review concept",
+                    ),
                     bloom_level=BloomLevel.KNOWLEDGE,
                 )
-                self.current_assessments.append(assessment)
-            except Exception:
-                pass
+                for domain_id, concept_id in due_concepts[:5]  # Limit to 5 per session
+            ),
+            return_exceptions=True,
+        )
+        self.current_assessments = [
+            result for result in results if not isinstance(result, BaseException)
+        ]
 
         if self.current_assessments:
             self.state = SessionState.ASSESSMENT
@@ -581,7 +654,7 @@ class SessionController:
             return
 
         try:
-            content = path.read_text(encoding="utf-8")
+            content = await asyncio.to_thread(path.read_text, encoding="utf-8")
             self.console.print(f"[green]Loaded: {path.name}[/green]")
             await self._study_content(content)
         except Exception as e:
@@ -664,20 +737,71 @@ class SessionController:
         """End the session."""
         self.running = False
 
+    async def _save_learner(self) -> None:
+        """Save the learner and drop stats that predate the save."""
+        async with self._learner_lock:
+            await self.repo.save(self.learner)
+        self._stats_cache.clear()
+
+    async def _persist_loop(self) -> None:
+        """Save the learner shortly after mastery changes, coalescing bursts."""
+        while True:
+            await self._dirty.wait()
+            await asyncio.sleep(SAVE_DEBOUNCE_SECONDS)
+            self._dirty.clear()
+            try:
+                await self._save_learner()
+            except Exception:
+                # Keep the session going; the changes are retried next time
+                logger.exception("Background learner save failed")
+                self._dirty.set()
+
+    async def _stop_persist_loop(self) -> None:
+        """Cancel the background writer; the caller saves any pending changes."""
+        task, self._persist_task = self._persist_task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
     async def _end_session(self) -> None:
         """End the session and save progress."""
+        await self._stop_persist_loop()
+        self._dirty.clear()
         if self.learner:
             elapsed = (datetime.now(timezone.utc) - self.stats.start_time).total_seconds() / 60
             self.learner.total_study_time_minutes += int(elapsed)
 
             # Save learner progress
-            await self.repo.save(self.learner)
+            await self._save_learner()
 
         self._show_session_summary()
         self.console.print()
         self.console.print("[cyan]Session ended. Progress saved![/cyan]")
 
 
+# Canonical commands in help order; handlers are unbound and receive the controller
+_COMMANDS: tuple[REPLCommand, ...] = (
+    REPLCommand("help", ["h", "?"], "Show available commands", SessionController._cmd_help),
+    REPLCommand("stats", ["s"], "Show session statistics", SessionController._cmd_stats),
+    REPLCommand("progress", ["p"], "Show learning progress", SessionController._cmd_progress),
+    REPLCommand("review", ["r"], "Start spaced repetition review", SessionController._cmd_review),
+    REPLCommand("load", ["l"], "Load content from a file", SessionController._cmd_load),
+    REPLCommand("concept", ["c"], "Show current concept details", SessionController._cmd_concept),
+    REPLCommand("skip", [], "Skip current assessment", SessionController._cmd_skip),
+    REPLCommand("hint", [], "Get a hint for current assessment", SessionController._cmd_hint),
+    REPLCommand("quit", ["q", "exit"], "End the session", SessionController._cmd_quit),
+)
+
+# Command names and aliases -> command
+_COMMAND_MAP: Mapping[str, REPLCommand] = MappingProxyType(
+    {name: cmd for cmd in _COMMANDS for name in (cmd.name, *cmd.aliases)}
+)
+
+
 async def start_session(
     learner_id: str,
     domain_id: str,
@@ -0,0 +1,206 @@
+"""Tests for the GUI application state."""
+
+import asyncio
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from holocron.gui.app import AppState
+
+
+@pytest.fixture
+def temp_db_path():
+    """Create a temporary database file."""
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        path = Path(f.name)
+    yield path
+    # Cleanup, including WAL side files
+    for file in (path, path.with_name(path.name + "-wal"), path.with_name(path.name + "-shm")):
+        if file.exists():
+            file.unlink()
+
+
+@pytest.fixture
+def state(temp_db_path):
+    """Create an app state backed by a temporary database."""
+    with patch("holocron.gui.app.get_default_db_path", return_value=temp_db_path):
+        yield AppState()
+
+
+def run(coro):
+    """Run async code in tests."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+    return loop.run_until_complete(coro)
+
+
+def run_app(state, coro):
+    """Run async test code, then shut the app state down on the same loop.
+
+    The background flush task is bound to the loop that started it, so it
+    can't be cancelled from fixture teardown.
+    """
+
+    async def wrapper():
+        try:
+            return await coro
+        finally:
+            await state.shutdown()
+
+    return run(wrapper())
+
+
+class TestLearnerCache:
+    """Tests for the learner profile cache."""
+
+    def test_get_learner_creates_and_caches(self, state):
+        """Test that a new learner is created once and then served from cache."""
+
+        async def test():
+            first = await state.get_learner("default")
+            with patch.object(state.repo, "get", wraps=state.repo.get) as repo_get:
+                second = await state.get_learner("default")
+            return first, second, repo_get.await_count
+
+        first, second, reads = run_app(state, test())
+
+        assert first.name == "Default"
+        assert second is first
+        assert reads == 0
+
+    def test_get_learner_rereads_after_ttl(self, state):
+        """Test that an expired learner is loaded from the repository again."""
+
+        async def test():
+            await state.get_learner("default")
+            with patch("holocron.gui.app.LEARNER_CACHE_TTL", 0), \
+                    patch.object(state.repo, "get", wraps=state.repo.get) as repo_get:
+                await state.get_learner("default")
+            return repo_get.await_count
+
+        assert run_app(state, test()) == 1
+
+
+class TestQueryCache:
+    """Tests for cached dashboard and review queries."""
+
+    def test_stats_cached_until_save(self, state):
+        """Test that stats are reused until the learner is saved."""
+
+        async def test():
+            await state.ensure_ready()
+            with patch.object(
+                state.repo, "get_learner_stats", wraps=state.repo.get_learner_stats
+            ) as get_stats:
+                await state.get_learner_stats("default")
+                await state.get_learner_stats("default")
+                cached_count = get_stats.await_count
+
+                state.current_learner.total_study_time_minutes = 15
+                await state.save_learner()
+                stats = await state.get_learner_stats("default")
+                return cached_count, get_stats.await_count, stats
+
+        cached_count, total_count, stats = run_app(state, test())
+
+        assert cached_count == 1
+        assert total_count == 2
+        assert stats["total_study_time_minutes"] == 15
+
+    def test_concurrent_misses_share_one_query(self, state):
+        """Test that simultaneous requests for the same stats run one query."""
+
+        async def test():
+            await state.ensure_ready()
+            with patch.object(
+                state.repo, "get_learner_stats", wraps=state.repo.get_learner_stats
+            ) as get_stats:
+                results = await asyncio.gather(
+                    *(state.get_learner_stats("default") for _ in range(3))
+                )
+            return results, get_stats.await_count
+
+        results, count = run_app(state, test())
+
+        assert count == 1
+        assert results[0] is results[1] is results[2]
+
+    def test_query_straddling_save_is_not_cached(self, state):
+        """Test that a query that started before a save doesn't repopulate the cache."""
+
+        async def test():
+            await state.ensure_ready()
+            started = asyncio.Event()
+            release = asyncio.Event()
+            real_stats = state.repo.get_learner_stats
+
+            async def slow_stats(learner_id):
+                result = await real_stats(learner_id)
+                started.set()
+                await release.wait()
+                return result
+
+            with patch.object(state.repo, "get_learner_stats", side_effect=slow_stats):
+                pending = asyncio.create_task(state.get_learner_stats("default"))
+                await started.wait()
+                await state.save_learner()
+                release.set()
+                await pending
+
+            return state._query_cache
+
+        assert run_app(state, test()) == {}
+
+
+class TestFlush:
+    """Tests for deferred learner saves."""
+
+    def test_flush_saves_dirty_learner(self, state):
+        """Test that flush() saves once and clears the dirty flag."""
+
+        async def test():
+            await state.ensure_ready()
+            state.mark_dirty()
+            with patch.object(state.repo, "save", wraps=state.repo.save) as save:
+                await state.flush()
+                await state.flush()
+            return save.await_count, state._dirty
+
+        saves, dirty = run_app(state, test())
+
+        assert saves == 1
+        assert dirty is False
+
+    def test_failed_flush_stays_dirty(self, state):
+        """Test that a failed save leaves the learner dirty for the next flush."""
+
+        async def test():
+            await state.ensure_ready()
+            state.mark_dirty()
+            with patch.object(state.repo, "save", side_effect=RuntimeError("locked")):
+                with pytest.raises(RuntimeError):
+                    await state.flush()
+            return state._dirty
+
+        assert run_app(state, test()) is True
+
+    def test_shutdown_closes_database_when_flush_fails(self, state):
+        """Test that shutdown stops the flush loop and closes the pool after a failed save."""
+
+        async def test():
+            await state.ensure_ready()
+            state.mark_dirty()
+            with patch.object(state.repo, "save", side_effect=RuntimeError("locked")):
+                with pytest.raises(RuntimeError):
+                    await state.shutdown()
+            return state._flush_task, len(state.db._connections)
+
+        flush_task, open_connections = run_app(state, test())
+
+        assert flush_task is None
+        assert open_connections == 0
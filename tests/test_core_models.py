@@ -151,6 +151,23 @@ class TestLearnerProfile:
 
         assert mastery2.recognition_score == 50
 
+    def test_get_masteries_bulk(self):
+        """Test that get_masteries returns existing and new records by key."""
+        profile = LearnerProfile(
+            learner_id="learner1",
+            name="Test Learner",
+        )
+        existing = profile.get_mastery("python", "concept1")
+        existing.recognition_score = 50
+
+        masteries = profile.get_masteries(
+            [("python", "concept1"), ("reading", "concept2")]
+        )
+
+        assert masteries[("python", "concept1")] is existing
+        assert masteries[("reading", "concept2")].learner_id == "learner1"
+        assert "concept2" in profile.domain_mastery["reading"]
+
     def test_domain_overall_mastery(self):
         """Test domain-wide mastery calculation."""
         profile = LearnerProfile(
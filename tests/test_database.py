@@ -1,13 +1,16 @@
 """Tests for SQLite database persistence."""
 
 import asyncio
+import sqlite3
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
+from unittest.mock import call, patch
 
 import pytest
 
 from holocron.core.models import (
+    AssessmentResult,
     ConceptMastery,
     LearnerPreferences,
     LearnerProfile,
@@ -21,21 +24,27 @@ def temp_db_path():
     with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
         path = Path(f.name)
     yield path
-    # Cleanup
-    if path.exists():
-        path.unlink()
+    # Cleanup, including WAL side files
+    for file in (path, path.with_name(path.name + "-wal"), path.with_name(path.name + "-shm")):
+        if file.exists():
+            file.unlink()
 
 
 @pytest.fixture
 def database(temp_db_path):
     """Create a database instance."""
-    return Database(temp_db_path)
+    db = Database(temp_db_path)
+    yield db
+    run(db.close())
 
 
 @pytest.fixture
 def repository(database):
-    """Create a repository instance."""
-    return LearnerRepository(database)
+    """Create a repository instance.
+
+    Profile caching is disabled so reads go through the database.
+    """
+    return LearnerRepository(database, cache_size=0)
 
 
 @pytest.fixture
@@ -85,6 +94,124 @@ class TestDatabase:
         assert "concept_mastery" in tables
         assert "assessment_results" in tables
 
+    def test_initialize_adds_version_column(self, database, temp_db_path):
+        """Test that databases from before learners.version are migrated."""
+        with sqlite3.connect(temp_db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE learners (
+                    learner_id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    preferences TEXT NOT NULL,
+                    total_study_time_minutes INTEGER DEFAULT 0,
+                    concepts_mastered INTEGER DEFAULT 0,
+                    current_streak_days INTEGER DEFAULT 0,
+                    last_study_date TEXT
+                )
+                """
+            )
+        conn.close()
+
+        async def test():
+            await database.initialize()
+            async with database.connection() as conn:
+                cursor = await conn.execute("PRAGMA table_info(learners)")
+                return [row[1] async for row in cursor]
+
+        assert "version" in run(test())
+
+    def test_uses_wal_and_foreign_keys(self, database):
+        """Test that connections use WAL journaling and enforce foreign keys."""
+
+        async def test():
+            async with database.connection() as conn:
+                cursor = await conn.execute("PRAGMA journal_mode")
+                journal_mode = (await cursor.fetchone())[0]
+                cursor = await conn.execute("PRAGMA foreign_keys")
+                foreign_keys = (await cursor.fetchone())[0]
+                return journal_mode, foreign_keys
+
+        journal_mode, foreign_keys = run(test())
+        assert journal_mode == "wal"
+        assert foreign_keys == 1
+
+    def test_connections_are_reused(self, database):
+        """Test that sequential connection() calls share a pooled connection."""
+
+        async def test():
+            async with database.connection() as first:
+                pass
+            async with database.connection() as second:
+                pass
+            return first, second
+
+        first, second = run(test())
+        assert first is second
+
+    def test_pool_opens_separate_connections_when_busy(self, database):
+        """Test that concurrent users get distinct connections."""
+
+        async def test():
+            async with database.connection() as first:
+                async with database.connection() as second:
+                    return first is second
+
+        assert run(test()) is False
+
+    def test_close_closes_checked_out_connections(self, database):
+        """Test that close() also closes connections still in use."""
+
+        async def test():
+            async with database.connection() as busy:
+                async with database.connection() as idle:
+                    pass
+                await database.close()
+            # The closed connection isn't handed out again
+            async with database.connection() as fresh:
+                reused = fresh is idle or fresh is busy
+            return idle, busy, reused
+
+        idle, busy, reused = run(test())
+
+        for conn in (idle, busy):
+            with pytest.raises(ValueError):
+                run(conn.execute("SELECT 1"))
+        assert idle is not busy
+        assert reused is False
+
+    def test_close_optimizes_every_connection(self, database):
+        """Test that close() runs PRAGMA optimize on idle and checked-out connections."""
+
+        async def test():
+            async with database.connection() as busy:
+                async with database.connection() as idle:
+                    pass
+                with patch.object(busy, "execute", wraps=busy.execute) as busy_execute, \
+                        patch.object(idle, "execute", wraps=idle.execute) as idle_execute:
+                    await database.close()
+            return busy_execute.call_args_list, idle_execute.call_args_list
+
+        busy_calls, idle_calls = run(test())
+
+        assert busy_calls == [call("PRAGMA optimize")]
+        assert idle_calls == [call("PRAGMA optimize")]
+
+    def test_async_context_manager(self, temp_db_path):
+        """Test that ``async with Database`` initializes and closes."""
+
+        async def test():
+            async with Database(temp_db_path) as db:
+                async with db.connection() as conn:
+                    cursor = await conn.execute("SELECT name FROM sqlite_master WHERE name = 'learners'")
+                    row = await cursor.fetchone()
+            return db, row
+
+        db, row = run(test())
+
+        assert row is not None
+        assert not db._connections
+
 
 class TestLearnerRepository:
     """Tests for LearnerRepository class."""
@@ -145,6 +272,21 @@ class TestLearnerRepository:
         profiles = run(test())
         assert len(profiles) == 3
 
+    def test_list_summaries(self, repository):
+        """Test listing learner summaries."""
+
+        async def test():
+            for learner_id, name in [("u2", "Bob"), ("u1", "Alice")]:
+                profile = LearnerProfile(learner_id=learner_id, name=name)
+                profile.total_study_time_minutes = 15
+                await repository.save(profile)
+            return await repository.list_summaries()
+
+        summaries = run(test())
+        assert [s.name for s in summaries] == ["Alice", "Bob"]
+        assert summaries[0].learner_id == "u1"
+        assert summaries[0].total_study_time_minutes == 15
+
     def test_delete(self, repository, sample_profile):
         """Test deleting a profile."""
 
@@ -196,6 +338,27 @@ class TestLearnerRepository:
         assert mastery.application_score == 40.0
         assert mastery.exposure_count == 5
 
+    def test_get_groups_mastery_by_domain(self, repository, sample_profile):
+        """Test that get() rebuilds mastery for several domains."""
+
+        async def test():
+            for domain_id, concept_ids in (
+                ("python-programming", ["python.loops", "python.functions"]),
+                ("reading-skills", ["reading.main_idea"]),
+            ):
+                sample_profile.domain_mastery[domain_id] = {
+                    concept_id: ConceptMastery(concept_id=concept_id, learner_id=sample_profile.learner_id)
+                    for concept_id in concept_ids
+                }
+            await repository.save(sample_profile)
+            return await repository.get(sample_profile.learner_id)
+
+        retrieved = run(test())
+
+        assert retrieved.name == sample_profile.name
+        assert set(retrieved.domain_mastery["python-programming"]) == {"python.loops", "python.functions"}
+        assert set(retrieved.domain_mastery["reading-skills"]) == {"reading.main_idea"}
+
     def test_update_profile(self, repository, sample_profile):
         """Test updating an existing profile."""
 
@@ -214,6 +377,52 @@ class TestLearnerRepository:
         assert retrieved.name == "Updated Name"
         assert retrieved.total_study_time_minutes == 100
 
+    def test_profile_cache(self, database, sample_profile):
+        """Test that get() serves cached profiles until they are deleted."""
+        repository = LearnerRepository(database, cache_size=1)
+
+        async def test():
+            await repository.save(sample_profile)
+            first = await repository.get(sample_profile.learner_id)
+            second = await repository.get(sample_profile.learner_id)
+            await repository.delete(sample_profile.learner_id)
+            after_delete = await repository.get(sample_profile.learner_id)
+            return first, second, after_delete
+
+        first, second, after_delete = run(test())
+        assert first is sample_profile
+        assert second is sample_profile
+        assert after_delete is None
+
+    def test_profile_cache_sees_other_writers(self, database, sample_profile):
+        """Test that a cached profile is reloaded after another repository saves."""
+        repository = LearnerRepository(database, cache_size=1)
+        other = LearnerRepository(database, cache_size=1)
+
+        async def test():
+            await repository.save(sample_profile)
+            updated = await other.get(sample_profile.learner_id)
+            updated.name = "Renamed"
+            await other.save(updated)
+            return await repository.get(sample_profile.learner_id)
+
+        reloaded = run(test())
+        assert reloaded is not sample_profile
+        assert reloaded.name == "Renamed"
+
+    def test_profile_cache_evicts_least_recent(self, database):
+        """Test that the profile cache stays within its size."""
+        repository = LearnerRepository(database, cache_size=1)
+
+        async def test():
+            await repository.save(LearnerProfile(learner_id="a", name="A"))
+            await repository.save(LearnerProfile(learner_id="b", name="B"))
+            return list(repository._cache), await repository.get("a")
+
+        cached_ids, reloaded = run(test())
+        assert cached_ids == ["b"]
+        assert reloaded.name == "A"
+
     def test_get_concepts_due_for_review(self, repository, sample_profile):
         """Test getting concepts due for review."""
 
@@ -236,6 +445,58 @@ class TestLearnerRepository:
         assert len(due) == 1
         assert due[0] == ("python-programming", "python.list_comprehension")
 
+    def test_get_concepts_due_for_review_paginated(self, repository, sample_profile):
+        """Test limit and offset on the due-for-review query."""
+
+        async def test():
+            sample_profile.domain_mastery["python-programming"] = {
+                f"python.concept_{i}": ConceptMastery(
+                    concept_id=f"python.concept_{i}",
+                    learner_id=sample_profile.learner_id,
+                )
+                for i in range(5)
+            }
+
+            await repository.save(sample_profile)
+            first = await repository.get_concepts_due_for_review(
+                sample_profile.learner_id, limit=3
+            )
+            rest = await repository.get_concepts_due_for_review(
+                sample_profile.learner_id, limit=3, offset=3
+            )
+            return first, rest
+
+        first, rest = run(test())
+
+        assert len(first) == 3
+        assert len(rest) == 2
+        assert not set(first) & set(rest)
+
+    def test_get_due_review_rows(self, repository, sample_profile):
+        """Test that due review rows carry display name and mastery."""
+
+        async def test():
+            sample_profile.domain_mastery["python-programming"] = {
+                "python.list_comprehension": ConceptMastery(
+                    concept_id="python.list_comprehension",
+                    learner_id=sample_profile.learner_id,
+                    recognition_score=100.0,
+                    comprehension_score=100.0,
+                    application_score=0.0,
+                ),
+            }
+
+            await repository.save(sample_profile)
+            return await repository.get_due_review_rows(sample_profile.learner_id)
+
+        rows = run(test())
+
+        assert len(rows) == 1
+        assert rows[0].domain_id == "python-programming"
+        assert rows[0].concept_id == "python.list_comprehension"
+        assert rows[0].display_name == "List Comprehension"
+        assert rows[0].mastery_pct == pytest.approx(50.0)
+
     def test_get_learner_stats(self, repository, sample_profile):
         """Test getting learner statistics."""
 
@@ -262,6 +523,48 @@ class TestLearnerRepository:
         assert stats["total_study_time_minutes"] == 120
         assert "python-programming" in stats["domains"]
         assert stats["domains"]["python-programming"]["concept_count"] == 1
+        assert stats["domains"]["python-programming"]["avg_mastery"] == 74.0
+        assert stats["concepts_due_for_review"] == 1
+        assert stats["total_assessments"] == 0
+        assert stats["accuracy"] == 0
+
+    def test_save_assessment_results_bulk(self, repository, sample_profile):
+        """Test saving several assessment results at once."""
+
+        def result(assessment_id, is_correct):
+            return AssessmentResult(
+                assessment_id=assessment_id,
+                learner_id=sample_profile.learner_id,
+                timestamp=datetime.now(timezone.utc),
+                response="answer",
+                is_correct=is_correct,
+                score=1.0 if is_correct else 0.0,
+            )
+
+        async def test():
+            await repository.save(sample_profile)
+            await repository.save_assessment_results(
+                sample_profile.learner_id,
+                "python-programming",
+                [
+                    ("python.loops", result("a1", True)),
+                    ("python.functions", result("a2", False)),
+                ],
+            )
+            async with repository.db.connection() as conn:
+                cursor = await conn.execute(
+                    "SELECT concept_id FROM assessment_results ORDER BY assessment_id"
+                )
+                concept_ids = [row[0] async for row in cursor]
+            stats = await repository.get_learner_stats(sample_profile.learner_id)
+            return concept_ids, stats
+
+        concept_ids, stats = run(test())
+
+        assert concept_ids == ["python.loops", "python.functions"]
+        assert stats["total_assessments"] == 2
+        assert stats["correct_assessments"] == 1
+        assert stats["accuracy"] == 50.0
 
     def test_stats_for_nonexistent_learner(self, repository):
         """Test getting stats for a learner that doesn't exist."""
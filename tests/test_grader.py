@@ -1,7 +1,8 @@
 """Tests for assessment grading module."""
 
+import asyncio
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -246,6 +247,35 @@ class TestAssessmentGraderFreeResponse:
 
         assert result.score == 1.0  # Clamped from 1.5
 
+    @patch("holocron.core.grader.LLMClient")
+    def test_agrade_uses_async_client(self, mock_llm_class, free_response_assessment):
+        """Test that agrade() grades through the async LLM call."""
+        mock_client = MagicMock()
+        mock_client.acomplete = AsyncMock(return_value=MagicMock(
+            content='{"score": 0.75, "feedback": "Mostly right"}'
+        ))
+        mock_llm_class.return_value = mock_client
+
+        grader = AssessmentGrader()
+        result = asyncio.run(grader.agrade(free_response_assessment, "Some response"))
+
+        assert result.score == 0.75
+        assert result.is_correct is True
+        mock_client.complete.assert_not_called()
+
+    @patch("holocron.core.grader.LLMClient")
+    def test_agrade_api_error_fallback(self, mock_llm_class, free_response_assessment):
+        """Test that agrade() falls back like grade() when the LLM API fails."""
+        mock_client = MagicMock()
+        mock_client.acomplete = AsyncMock(side_effect=Exception("API Error"))
+        mock_llm_class.return_value = mock_client
+
+        grader = AssessmentGrader()
+        result = asyncio.run(grader.agrade(free_response_assessment, "Some response"))
+
+        assert result.score == 0.5
+        assert "Unable to grade" in result.feedback
+
 
 class TestAssessmentGraderBloomLevels:
     """Tests for Bloom level-specific grading."""
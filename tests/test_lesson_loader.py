@@ -0,0 +1,71 @@
+"""Tests for the lesson loader."""
+
+import json
+
+import pytest
+
+from holocron.content import Lesson, LessonCategory, LessonLoader
+
+
+@pytest.fixture
+def loader(monkeypatch) -> type[LessonLoader]:
+    """Give LessonLoader empty registries so tests don't see or leak lessons."""
+    monkeypatch.setattr(LessonLoader, "_builtin_lessons", {})
+    monkeypatch.setattr(LessonLoader, "_custom_lessons", {})
+    monkeypatch.setattr(LessonLoader, "_grouped_cache", {})
+    monkeypatch.setattr(LessonLoader, "_domains_cache", None)
+    return LessonLoader
+
+
+def make_lesson(lesson_id: str, domain_id: str = "test-domain", **kwargs) -> Lesson:
+    """Create a minimal lesson."""
+    return Lesson(
+        lesson_id=lesson_id,
+        domain_id=domain_id,
+        title=lesson_id.title(),
+        description="A test lesson",
+        content="Content",
+        **kwargs,
+    )
+
+
+class TestLessonLoader:
+    """Tests for LessonLoader and its cached views."""
+
+    def test_get_lessons_grouped(self, loader):
+        """Test that lessons are grouped by category and sorted by difficulty."""
+        loader.register_builtin(make_lesson("hard", difficulty=5))
+        loader.register_builtin(make_lesson("easy", difficulty=1))
+        loader.register_builtin(make_lesson("deep", category=LessonCategory.ADVANCED))
+
+        grouped = loader.get_lessons_grouped("test-domain")
+
+        assert [title for title, _ in grouped] == ["Advanced", "Fundamentals"]
+        assert [l.lesson_id for l in grouped[1][1]] == ["easy", "hard"]
+
+    def test_registered_lesson_appears_after_grouping(self, loader):
+        """Test that registering a lesson invalidates the cached grouping."""
+        loader.register_builtin(make_lesson("first"))
+        loader.get_lessons_grouped("test-domain")
+        loader.list_domains_with_lessons()
+
+        loader.register_builtin(make_lesson("second", domain_id="other-domain"))
+        loader.register_builtin(make_lesson("third"))
+
+        lessons = loader.get_lessons_grouped("test-domain")[0][1]
+        assert [l.lesson_id for l in lessons] == ["first", "third"]
+        assert loader.list_domains_with_lessons() == ["other-domain", "test-domain"]
+
+    def test_loaded_lesson_appears_after_grouping(self, loader, tmp_path):
+        """Test that loading lessons from a file invalidates the cached grouping."""
+        loader.register_builtin(make_lesson("builtin"))
+        assert len(loader.get_lessons_grouped("test-domain")) == 1
+
+        path = tmp_path / "lessons.json"
+        path.write_text(json.dumps({
+            "lessons": [make_lesson("custom", category=LessonCategory.PRACTICE).to_dict()],
+        }))
+        loader.load_from_file(path)
+
+        grouped = dict(loader.get_lessons_grouped("test-domain"))
+        assert [l.lesson_id for l in grouped["Practice"]] == ["custom"]
@@ -1,6 +1,7 @@
 """Tests for LLM client module."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -134,6 +135,24 @@ class TestLLMClient:
             expected = 1000 / 1000 * 0.03 + 500 / 1000 * 0.06
             assert cost == expected
 
+    def test_estimate_cost_gpt4_turbo(self):
+        """Test that GPT-4 Turbo isn't priced as GPT-4."""
+        with patch("holocron.llm.client.get_settings") as mock_settings:
+            mock_settings.return_value = MagicMock(
+                default_model="gpt-4-turbo",
+                temperature=0.7,
+                anthropic_api_key=None,
+                openai_api_key=None,
+                gemini_api_key=None,
+            )
+
+            client = LLMClient()
+            cost = client.estimate_cost(1000, 500)
+
+            # GPT-4 Turbo: $0.01/1K input, $0.03/1K output
+            expected = 1000 / 1000 * 0.01 + 500 / 1000 * 0.03
+            assert cost == expected
+
     def test_estimate_cost_claude(self):
         """Test cost estimation for Claude."""
         with patch("holocron.llm.client.get_settings") as mock_settings:
@@ -201,6 +220,8 @@ class TestLLMClient:
             assert result.content == "This is the response"
             assert result.model == "gpt-4"
             assert result.usage["total_tokens"] == 30
+            # The provider response isn't retained unless keep_raw is set
+            assert result.raw_response is None
 
             # Verify the call was made correctly
             mock_litellm.completion.assert_called_once()
@@ -210,6 +231,9 @@ class TestLLMClient:
             assert call_args.kwargs["messages"][0]["role"] == "system"
             assert call_args.kwargs["messages"][1]["role"] == "user"
 
+            raw_client = LLMClient(keep_raw=True)
+            assert raw_client.complete(user_message="Hello").raw_response is mock_response
+
     @patch("holocron.llm.client.litellm")
     def test_complete_without_system_prompt(self, mock_litellm):
         """Test completion without system prompt."""
@@ -239,6 +263,67 @@ class TestLLMClient:
             assert len(call_args.kwargs["messages"]) == 1
             assert call_args.kwargs["messages"][0]["role"] == "user"
 
+    @patch("holocron.llm.client.litellm")
+    def test_acomplete(self, mock_litellm):
+        """Test async completion."""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "Async response"
+        mock_response.model = "gpt-4"
+        mock_response.usage.prompt_tokens = 5
+        mock_response.usage.completion_tokens = 10
+        mock_response.usage.total_tokens = 15
+        mock_litellm.acompletion = AsyncMock(return_value=mock_response)
+
+        with patch("holocron.llm.client.get_settings") as mock_settings:
+            mock_settings.return_value = MagicMock(
+                default_model="gpt-4",
+                temperature=0.7,
+                anthropic_api_key=None,
+                openai_api_key=None,
+                gemini_api_key=None,
+            )
+
+            client = LLMClient()
+            result = asyncio.run(client.acomplete(user_message="Hello", system_prompt="Be brief"))
+
+            assert result.content == "Async response"
+            assert result.usage["total_tokens"] == 15
+            call_args = mock_litellm.acompletion.call_args
+            assert [m["role"] for m in call_args.kwargs["messages"]] == ["system", "user"]
+            mock_litellm.completion.assert_not_called()
+
+    @patch("holocron.llm.client.litellm")
+    def test_complete_cache(self, mock_litellm):
+        """Test that identical requests are served from the completion cache."""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "Cached"
+        mock_response.model = "gpt-4"
+        mock_response.usage.prompt_tokens = 5
+        mock_response.usage.completion_tokens = 10
+        mock_response.usage.total_tokens = 15
+        mock_litellm.completion.return_value = mock_response
+
+        with patch("holocron.llm.client.get_settings") as mock_settings:
+            mock_settings.return_value = MagicMock(
+                default_model="gpt-4",
+                temperature=0.7,
+                anthropic_api_key=None,
+                openai_api_key=None,
+                gemini_api_key=None,
+            )
+
+            client = LLMClient(cache_size=1)
+            first = client.complete(user_message="Hello")
+            second = client.complete(user_message="Hello")
+            client.complete(user_message="Different")
+            client.complete(user_message="Hello")
+
+            assert first is second
+            # The second "Hello" hit the cache; "Different" evicted it
+            assert mock_litellm.completion.call_count == 3
+
     @patch("holocron.llm.client.litellm")
     def test_complete_with_callback_no_callback(self, mock_litellm):
         """Test complete_with_callback without callback falls back to complete."""
@@ -303,9 +388,48 @@ class TestLLMClient:
             )
 
             assert result.content == "Hello World"
-            assert chunks_received == ["Hello ", "World"]
+            # Short chunks are batched into a single callback
+            assert chunks_received == ["Hello World"]
             assert result.usage["total_tokens"] == 0  # Streaming doesn't return usage
 
+    @patch("holocron.llm.client.litellm")
+    def test_acomplete_with_streaming_callback(self, mock_litellm):
+        """Test async streaming completion with callback."""
+        long_part = "x" * 40
+        chunks = []
+        for content in [long_part, "Hello ", "World", None]:
+            chunk = MagicMock()
+            chunk.choices = [MagicMock()]
+            chunk.choices[0].delta.content = content
+            chunks.append(chunk)
+
+        async def stream():
+            for chunk in chunks:
+                yield chunk
+
+        mock_litellm.acompletion = AsyncMock(return_value=stream())
+
+        with patch("holocron.llm.client.get_settings") as mock_settings:
+            mock_settings.return_value = MagicMock(
+                default_model="gpt-4",
+                temperature=0.7,
+                anthropic_api_key=None,
+                openai_api_key=None,
+                gemini_api_key=None,
+            )
+
+            client = LLMClient()
+            chunks_received = []
+            result = asyncio.run(client.acomplete_with_callback(
+                user_message="Hello",
+                callback=lambda x: chunks_received.append(x),
+            ))
+
+            assert result.content == long_part + "Hello World"
+            assert chunks_received == [long_part, "Hello World"]
+            assert mock_litellm.acompletion.call_args.kwargs["stream"] is True
+            mock_litellm.completion.assert_not_called()
+
 
 class TestQuickComplete:
     """Tests for quick_complete convenience function."""
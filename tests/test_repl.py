@@ -2,9 +2,10 @@
 
 import asyncio
 import tempfile
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from rich.console import Console
@@ -28,8 +29,11 @@ def temp_db():
         path = Path(f.name)
     db = Database(path)
     yield db
-    if path.exists():
-        path.unlink()
+    # Pooled connections keep worker threads alive until closed
+    run(db.close())
+    for file in (path, path.with_name(path.name + "-wal"), path.with_name(path.name + "-shm")):
+        if file.exists():
+            file.unlink()
 
 
 @pytest.fixture
@@ -45,13 +49,13 @@ def mock_console():
 def mock_grader():
     """Create a mock grader."""
     grader = MagicMock()
-    grader.grade.return_value = GradingResult(
+    grader.agrade = AsyncMock(return_value=GradingResult(
         score=0.85,
         is_correct=True,
         feedback="Good answer!",
         strengths=["Clear understanding"],
         areas_for_improvement=["Add more detail"],
-    )
+    ))
     return grader
 
 
@@ -334,7 +338,7 @@ class TestAssessmentGrading:
             controller.current_assessment_index = 0
 
             # Mock grader returns correct
-            mock_grader.grade.return_value = GradingResult(
+            mock_grader.agrade.return_value = GradingResult(
                 score=1.0,
                 is_correct=True,
                 feedback="Perfect!",
@@ -375,7 +379,7 @@ class TestAssessmentGrading:
             controller.current_assessment_index = 0
 
             # Mock grader returns incorrect
-            mock_grader.grade.return_value = GradingResult(
+            mock_grader.agrade.return_value = GradingResult(
                 score=0.3,
                 is_correct=False,
                 feedback="Not quite.",
@@ -471,3 +475,217 @@ class TestCommandHandling:
 
         calls = [str(c) for c in mock_console.print.call_args_list]
         assert any("Usage" in str(c) for c in calls)
+
+    def test_progress_stats_cached(self, temp_db, mock_console, mock_grader):
+        """Test /progress reuses stats until an answer changes mastery."""
+        controller = SessionController(
+            learner_id="test-learner",
+            domain_id="reading-skills",
+            db=temp_db,
+            console=mock_console,
+            grader=mock_grader,
+        )
+
+        async def test():
+            await controller.initialize()
+            with patch.object(
+                controller.repo, "get_learner_stats", wraps=controller.repo.get_learner_stats
+            ) as get_stats:
+                before = await controller._get_progress_stats()
+                await controller._cmd_progress([])
+                cached_count = get_stats.call_count
+
+                controller.state = SessionState.ASSESSMENT
+                controller.current_assessments = [
+                    Assessment(
+                        assessment_id="a1",
+                        concept_id="test.concept",
+                        bloom_level=BloomLevel.KNOWLEDGE,
+                        assessment_type=AssessmentType.FREE_RESPONSE,
+                        question="What is X?",
+                    ),
+                ]
+                controller.current_assessment_index = 0
+                await controller._handle_assessment_response("My answer")
+
+                # The answer hasn't been written by the background writer yet
+                after = await controller._get_progress_stats()
+                return before, cached_count, after, get_stats.call_count
+
+        before, cached_count, after, total_count = run(test())
+
+        assert cached_count == 1
+        assert total_count == 2
+        assert "reading-skills" not in before["domains"]
+        assert after["domains"]["reading-skills"]["concept_count"] == 1
+
+    def test_handle_command_dispatches_alias(self, temp_db, mock_console, mock_grader):
+        """Test aliases dispatch to the command handler."""
+        controller = SessionController(
+            learner_id="test-learner",
+            domain_id="reading-skills",
+            db=temp_db,
+            console=mock_console,
+            grader=mock_grader,
+        )
+        controller.running = True
+
+        run(controller._handle_command("q"))
+
+        assert controller.running is False
+        calls = [str(c) for c in mock_console.print.call_args_list]
+        assert not any("Error" in c for c in calls)
+
+    def test_cmd_review_skips_failed_generations(self, temp_db, mock_console, mock_grader):
+        """Test review keeps assessments that generated and drops failures."""
+        controller = SessionController(
+            learner_id="test-learner",
+            domain_id="reading-skills",
+            db=temp_db,
+            console=mock_console,
+            grader=mock_grader,
+        )
+
+        def generate(concept, bloom_level):
+            if concept.concept_id == "bad.concept":
+                raise ValueError("generation failed")
+            return Assessment(
+                assessment_id=f"review-{concept.concept_id}",
+                concept_id=concept.concept_id,
+                bloom_level=bloom_level,
+                assessment_type=AssessmentType.FREE_RESPONSE,
+                question=f"Explain {concept.name}",
+            )
+
+        async def test():
+            await controller.initialize()
+            due = [("reading-skills", "good.concept"), ("reading-skills", "bad.concept")]
+            with patch.object(controller.repo, "get_concepts_due_for_review", return_value=due), \
+                    patch.object(controller.adapter, "generate_assessment", side_effect=generate):
+                await controller._cmd_review([])
+
+        run(test())
+
+        assert [a.concept_id for a in controller.current_assessments] == ["good.concept"]
+        assert controller.state == SessionState.ASSESSMENT
+
+
+class TestPersistence:
+    """Tests for debounced learner persistence."""
+
+    def test_mastery_changes_coalesce_into_one_save(self, temp_db, mock_console, mock_grader):
+        """Test several dirty marks before the debounce elapses save once."""
+        controller = SessionController(
+            learner_id="test-learner",
+            domain_id="reading-skills",
+            db=temp_db,
+            console=mock_console,
+            grader=mock_grader,
+        )
+
+        async def test():
+            await controller.initialize()
+            with patch("holocron.repl.session.SAVE_DEBOUNCE_SECONDS", 0.01), \
+                    patch.object(controller.repo, "save") as save:
+                controller._persist_task = asyncio.create_task(controller._persist_loop())
+                controller._dirty.set()
+                controller._dirty.set()
+                await asyncio.sleep(0.05)
+                saves_before_end = save.await_count
+
+                await controller._end_session()
+                return saves_before_end, save.await_count, controller._persist_task
+
+        saves_before_end, total_saves, task = run(test())
+
+        assert saves_before_end == 1
+        assert total_saves == 2
+        assert task is None
+
+    def test_failed_background_save_is_retried(self, temp_db, mock_console, mock_grader):
+        """Test a failing save doesn't stop the writer or the final save."""
+        controller = SessionController(
+            learner_id="test-learner",
+            domain_id="reading-skills",
+            db=temp_db,
+            console=mock_console,
+            grader=mock_grader,
+        )
+
+        async def test():
+            await controller.initialize()
+            with patch("holocron.repl.session.SAVE_DEBOUNCE_SECONDS", 0.01), \
+                    patch.object(controller.repo, "save", side_effect=[RuntimeError("locked"), None, None]) as save, \
+                    patch("holocron.repl.session.logger"):
+                controller._persist_task = asyncio.create_task(controller._persist_loop())
+                controller._dirty.set()
+                await asyncio.sleep(0.1)
+                retried = save.await_count
+
+                await controller._end_session()
+                return retried, save.await_count
+
+        retried, total_saves = run(test())
+
+        assert retried == 2
+        assert total_saves == 3
+
+    def test_run_reads_input_off_the_event_loop(self, temp_db, mock_console, mock_grader):
+        """Test the prompt runs in a worker thread so background tasks keep running."""
+        controller = SessionController(
+            learner_id="test-learner",
+            domain_id="reading-skills",
+            db=temp_db,
+            console=mock_console,
+            grader=mock_grader,
+        )
+        prompt_threads = []
+
+        def ask(prompt):
+            prompt_threads.append(threading.current_thread())
+            return "/quit"
+
+        with patch("holocron.repl.session.Prompt.ask", side_effect=ask):
+            run(controller.run())
+
+        assert prompt_threads
+        assert prompt_threads[0] is not threading.main_thread()
+        assert controller._persist_task is None
+
+    def test_run_cleans_up_when_the_loop_fails(self, temp_db, mock_console, mock_grader):
+        """Test an error in the REPL loop still stops the writer, saves and closes."""
+        controller = SessionController(
+            learner_id="test-learner",
+            domain_id="reading-skills",
+            db=temp_db,
+            console=mock_console,
+            grader=mock_grader,
+        )
+        controller._owns_db = True
+
+        with patch("holocron.repl.session.Prompt.ask", side_effect=RuntimeError("tty gone")), \
+                patch.object(controller.repo, "save") as save:
+            with pytest.raises(RuntimeError):
+                run(controller.run())
+
+        assert controller._persist_task is None
+        # Creating the new profile, then the final save
+        assert save.await_count == 2
+        assert not temp_db._connections
+
+    def test_run_closes_owned_db_when_initialize_fails(self, temp_db, mock_console, mock_grader):
+        """Test a database the session opened is closed if initialization fails."""
+        controller = SessionController(
+            learner_id="test-learner",
+            domain_id="reading-skills",
+            db=temp_db,
+            console=mock_console,
+            grader=mock_grader,
+        )
+        controller._owns_db = True
+
+        with patch.object(controller, "initialize", return_value=False), \
+                patch.object(temp_db, "close") as close:
+            run(controller.run())
+
+        close.assert_awaited_once()